@@ -2,12 +2,14 @@
 
 #———————————————————————————————————————————————————————————————————————————————
 
-import os, asyncio, orjson, random, time, statistics, psutil, logging
+import asyncio, orjson, random, time, psutil, logging, hashlib
+import ctypes, ctypes.util
 from contextlib import asynccontextmanager
+from typing import Optional
 from collections import deque
 from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
 from fastapi import HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 
 from util import (
 	my_name,
@@ -60,7 +62,34 @@ class DashboardServer:
 			for symbol in self.state['SYMBOLS']
 		})
 
-		self._html_cache = None
+		self._html_cache: Optional[bytes] = None
+		self._html_etag:  Optional[str]	  = None
+
+		# One encoded frame per DASHBOARD_STREAM_INTERVAL, shared by every
+		# connected client (see `_frame_builder`).
+
+		self._cached_frame: bytes = b""
+
+		# The frame's dict layout is fixed, so it is allocated once and
+		# `_build_monitoring_data` only overwrites the leaf values.
+
+		symbols = self.state['SYMBOLS']
+
+		self._frame_view: dict = {
+			"med_latency":		 dict.fromkeys(symbols, 0),
+			"flush_interval":	 dict.fromkeys(symbols, -1),
+			"snapshot_interval": dict.fromkeys(symbols, 0),
+			"queue_size":		 dict.fromkeys(symbols, 0),
+			"queue_dropped":	 dict.fromkeys(symbols, 0),
+			"hardware": {
+				"network_mbps":	   0.0,
+				"cpu_percent":	   0.0,
+				"memory_percent":  0.0,
+				"storage_percent": 0.0,
+			},
+			"websocket_peer": "",
+			"last_updated":	  "",
+		}
 		
 		#———————————————————————————————————————————————————————————————————————
 		# Connection Management (No Locks - Atomic Operations under GIL)
@@ -94,6 +123,20 @@ class DashboardServer:
 		@asynccontextmanager
 		async def lifespan(app):
 
+			try:
+
+				await asyncio.to_thread(self._load_html)
+
+			except Exception as e:	# retried on the first GET
+
+				self.logger.error(
+					f"[{my_name()}] Failed to preload dashboard: {e}"
+				)
+
+			frame_builder_task = asyncio.create_task(
+				self._frame_builder()
+			)
+
 			try:
 
 				yield
@@ -114,6 +157,8 @@ class DashboardServer:
 
 			finally:
 
+				frame_builder_task.cancel()
+
 				if (
 					self.shutdown_manager
 					and not self.shutdown_manager.is_shutdown_complete()
@@ -127,7 +172,11 @@ class DashboardServer:
 		
 		# Create FastAPI app
 
-		app = FastAPI(lifespan=lifespan)
+		# orjson is already a dependency; any JSON route encodes through it
+		app = FastAPI(
+			lifespan=lifespan,
+			default_response_class=ORJSONResponse,
+		)
 		
 		# Register routes
 
@@ -149,37 +198,61 @@ class DashboardServer:
 	# Dashboard Page Handler
 	#———————————————————————————————————————————————————————————————————————————
 	
-	def _read_html_file(self, html_path: str) -> str:
+	def _load_html(self):
+
+		"""
+		Read `dashboard.html` once; every GET is then served from memory
+		with an ETag so that a browser refresh can be answered with 304.
+		"""
+
+		html_path = resource_path("dashboard.html", self.logger)
 
-		"""Synchronous file reading helper for async delegation."""
+		with open(html_path, "rb") as f:
 
-		with open(html_path, "r", encoding="utf-8") as f:
+			html = f.read()
 
-			return f.read()
+		# ETag first: `_html_cache` is the "loaded" flag
+
+		self._html_etag  = f'"{hashlib.sha1(html).hexdigest()}"'
+		self._html_cache = html
 	
 	async def _dashboard_page(self, request: Request):
 
 		try:
 
-			if self._html_cache is None:
+			if self._html_cache is None:		# lifespan preload failed
 
-				html_path = resource_path("dashboard.html", self.logger)
-				
-				if not await asyncio.to_thread(os.path.exists, html_path):
+				try:
+
+					await asyncio.to_thread(self._load_html)
+
+				except OSError as e:
 
 					self.logger.error(
-						f"[{my_name()}] HTML file not found: {html_path}"
+						f"[{my_name()}] HTML file not readable: {e}"
 					)
 					raise HTTPException(
 						status_code=500,
 						detail="Dashboard HTML file missing"
 					)
-				
-				self._html_cache = await asyncio.to_thread(
-					self._read_html_file, html_path
-				)
+
+			headers = {
+				"ETag":			 self._html_etag,
+				"Cache-Control": "max-age=300",
+			}
+
+			if request.headers.get("if-none-match") == self._html_etag:
+
+				return Response(status_code=304, headers=headers)
 			
-			return HTMLResponse(content=self._html_cache)
+			return HTMLResponse(
+				content = self._html_cache,
+				headers = headers,
+			)
+
+		except HTTPException:
+
+			raise
 			
 		except Exception as e:
 
@@ -199,11 +272,14 @@ class DashboardServer:
 	async def _build_monitoring_data(self) -> dict:
 
 		"""
-		Build monitoring data with async yield points for better GIL sharing.
+		Refresh `_frame_view` in place, with async yield points for
+		better GIL sharing.
 		"""
+
+		view = self._frame_view
 		
 		# Build median latency data with yield point
-		med_latency = {}
+		med_latency = view["med_latency"]
 		for symbol in self.state['SYMBOLS']:
 			med_latency[symbol] = self.state[
 				'LATENCY_DICT'
@@ -211,7 +287,7 @@ class DashboardServer:
 			await asyncio.sleep(0)
 		
 		# Build flush interval data with yield point
-		flush_interval = {}
+		flush_interval = view["flush_interval"]
 		for symbol in self.state['SYMBOLS']:
 			
 			symbol_data = self.state[
@@ -223,51 +299,87 @@ class DashboardServer:
 
 			else:
 				flush_interval[symbol] = int(
-					statistics.fmean(symbol_data)
+					sum(symbol_data) / len(symbol_data)
 				)
 
 			await asyncio.sleep(0)
 		
 		# Build snapshot interval data with yield point
-		snapshot_interval = {}
+		snapshot_interval = view["snapshot_interval"]
 		for symbol in self.state['SYMBOLS']:
 			
+			symbol_data = self.state[
+				'PUT_SNAPSHOT_INTERVAL'
+			].get(symbol)
+
 			snapshot_interval[symbol] = int(
-				statistics.fmean(
-					self.state[
-						'PUT_SNAPSHOT_INTERVAL'
-					].get(symbol)
-				)
+				sum(symbol_data) / len(symbol_data)
 			)
 			await asyncio.sleep(0)
 		
-		# Build queue size data with yield point
-		queue_size = {}
+		# Build queue size and eviction data with yield point
+		queue_size	  = view["queue_size"]
+		queue_dropped = view["queue_dropped"]
 		for symbol in self.state['SYMBOLS']:
-			self.snapshot_qsizes_dict[symbol].append(
-				self.state['SNAPSHOTS_QUEUE_DICT'][symbol].qsize()
-			)
+			queue = self.state['SNAPSHOTS_QUEUE_DICT'][symbol]
+			self.snapshot_qsizes_dict[symbol].append(queue.qsize())
+			queue_dropped[symbol] = queue.dropped
 			queue_size[symbol] = int(
-				statistics.fmean(self.snapshot_qsizes_dict[symbol])
+				sum(self.snapshot_qsizes_dict[symbol])
+				/ len(self.snapshot_qsizes_dict[symbol])
 			)
 			await asyncio.sleep(0)
+
+		hardware = view["hardware"]
+		hardware["network_mbps"]	= round(self.network_load_mbps, 2)
+		hardware["cpu_percent"]		= self.cpu_load_percentage
+		hardware["memory_percent"]	= self.mem_load_percentage
+		hardware["storage_percent"] = self.storage_percentage
+
+		view["websocket_peer"] = self.state['WEBSOCKET_PEER']['value']
+		view["last_updated"]   = ms_to_datetime(
+			get_current_time_ms()
+		).isoformat()
 		
-		return {
-			"med_latency":		 med_latency,
-			"flush_interval":	 flush_interval,
-			"snapshot_interval": snapshot_interval,
-			"queue_size":		 queue_size,
-			"hardware": {
-				"network_mbps":	   round(self.network_load_mbps, 2),
-				"cpu_percent":	   self.cpu_load_percentage,
-				"memory_percent":  self.mem_load_percentage,
-				"storage_percent": self.storage_percentage
-			},
-			"websocket_peer": self.state['WEBSOCKET_PEER']['value'],
-			"last_updated":	  ms_to_datetime(
-				get_current_time_ms()
-			).isoformat(),
-		}
+		return view
+
+	async def _frame_builder(self):
+
+		"""
+		Build and encode the monitoring payload once per tick,
+		independent of the number of connected clients. With no
+		client connected the tick is skipped and the stale frame is
+		dropped, so a new client never sees an old `last_updated`.
+		"""
+
+		while True:
+
+			try:
+
+				if self.active_connections > 0:
+
+					data = await self._build_monitoring_data()
+					self._cached_frame = orjson.dumps(data)
+
+				else:
+
+					self._cached_frame = b""
+
+			except asyncio.CancelledError:
+
+				raise
+
+			except Exception as e:
+
+				self.logger.warning(
+					f"[{my_name()}] "
+					f"failed to build dashboard frame: {e}",
+					exc_info=True
+				)
+
+			await asyncio.sleep(
+				self.config['DASHBOARD_STREAM_INTERVAL']
+			)
 
 	#———————————————————————————————————————————————————————————————————————————
 	# WebSocket Handler
@@ -326,13 +438,15 @@ class DashboardServer:
 
 						try:
 
-							# Build monitoring data with async yield points
+							# Frame is pre-encoded by `_frame_builder`;
+							# orjson already yields UTF-8, so it goes out
+							# as a binary frame.
 
-							data = await self._build_monitoring_data()
-							
-							await websocket.send_text(
-								orjson.dumps(data).decode()
-							)
+							frame = self._cached_frame
+
+							if frame:
+
+								await websocket.send_bytes(frame)
 							
 							# Check session time
 
@@ -427,128 +541,185 @@ class DashboardServer:
 				await asyncio.sleep(backoff)
 
 #———————————————————————————————————————————————————————————————————————————————
-# Hardware Monitoring Function
+# Hardware Monitoring
 #———————————————————————————————————————————————————————————————————————————————
 
-async def monitor_hardware(
-	dashboard_server: DashboardServer,		# Pass DashboardServer instance
-	hardware_monitoring_interval: float,
-	cpu_percent_duration:		  float,
-	desired_max_sys_mem_load:	  float,
-	logger: logging.Logger,
-):
+class HardwareMonitor:
 
 	"""
-	Hardware monitoring function that runs as an async coroutine.
-	Updates dashboard server's hardware metrics using psutil
-	with non-blocking operations.
+	Periodic hardware sampler driven by `loop.call_later`: one timer
+	callback per tick instead of a coroutine parked in `asyncio.sleep`.
+	Updates dashboard server's hardware metrics using psutil.
 	For details, see `https://psutil.readthedocs.io/en/latest/`.
 	"""
 
-	async def get_cpu_load() -> float:
+	def __init__(
+		self,
+		dashboard_server: DashboardServer,
+		hardware_monitoring_interval: float,
+		cpu_percent_duration:		  float,
+		desired_max_sys_mem_load:	  float,
+		logger: logging.Logger,
+	):
 
-		return await asyncio.to_thread(
-			psutil.cpu_percent,
-			interval=cpu_percent_duration
-		)
+		self.dashboard_server = dashboard_server
+		self.interval		  = hardware_monitoring_interval
+		self.cpu_duration	  = cpu_percent_duration
+		self.logger			  = logger
 
-	async def get_memory_load() -> float:
+		self._loop:   Optional[asyncio.AbstractEventLoop] = None
+		self._handle: Optional[asyncio.TimerHandle]		  = None
+		self._cpu_fut: Optional[asyncio.Future]			  = None
 
-		memory_info = await asyncio.to_thread(
-			psutil.virtual_memory
-		)
-		return memory_info.percent
+		self._prev_sent = 0
+		self._prev_recv = 0
+		self._prev_time = 0.0
+
+		self._last_trim = 0.0
+		self._malloc_trim = self._resolve_malloc_trim()
+
+	#———————————————————————————————————————————————————————————————————————————
+
+	# Long runs fragment the C heap (transient queue peaks, merge bursts);
+	# glibc's `malloc_trim(0)` hands free arena pages back to the kernel.
+	# No-op off glibc, e.g. under an LD_PRELOAD-ed jemalloc.
+
+	MALLOC_TRIM_INTERVAL_SEC = 60.0
+
+	@staticmethod
+	def _resolve_malloc_trim():
+
+		try:
+
+			libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6")
+			return libc.malloc_trim
+
+		except (OSError, AttributeError):
+
+			return None
+
+	#———————————————————————————————————————————————————————————————————————————
+
+	def start(self):
+
+		self._loop = asyncio.get_running_loop()
+
+		psutil.cpu_percent(interval=None)		# prime the non-blocking sampler
 
-	async def get_storage_load() -> float:
+		counters = psutil.net_io_counters()
+		self._prev_sent = counters.bytes_sent
+		self._prev_recv = counters.bytes_recv
+		self._prev_time = time.time()
 
-		disk_info = await asyncio.to_thread(
-			psutil.disk_usage, '/'
+		self.logger.info(
+			f"[{my_name()}]💻 hw monitor on"
 		)
 
-		return disk_info.percent
+		self._handle = self._loop.call_soon(self._tick)
+
+	def stop(self):
+
+		if self._handle is not None:
+
+			self._handle.cancel()
+			self._handle = None
+
+	#———————————————————————————————————————————————————————————————————————————
+
+	def _set_cpu_load(self, fut: asyncio.Future):
+
+		try:
+
+			self.dashboard_server.cpu_load_percentage = fut.result()
+
+		except Exception as e:
+
+			self.logger.error(
+				f"[{my_name()}] Error sampling cpu: {e}"
+			)
+
+	def _update_network_load(self):
 
-	async def get_network_load(
-		prev_sent, prev_recv, prev_time
-	):
-	
 		curr_time = time.time()
-		counters = await asyncio.to_thread(
-			psutil.net_io_counters
-		)
+		counters  = psutil.net_io_counters()
 		curr_sent = counters.bytes_sent
 		curr_recv = counters.bytes_recv
 
-		sent_diff = curr_sent - prev_sent
-		recv_diff = curr_recv - prev_recv
-		time_diff = curr_time - prev_time
+		time_diff = curr_time - self._prev_time
 
 		if time_diff > 0:
-			total_bytes = sent_diff + recv_diff
+			total_bytes = (
+				(curr_sent - self._prev_sent)
+				+ (curr_recv - self._prev_recv)
+			)
 			network_load_mbps = (
-				(total_bytes * 8) 
+				(total_bytes * 8)
 				/ (time_diff * 1_000_000)
 			)
 		else:
 			network_load_mbps = 0.0
 
-		return (
-			network_load_mbps,
-			curr_sent,
-			curr_recv,
-			curr_time
-		)
+		self.dashboard_server.network_load_mbps = network_load_mbps
 
-	prev_counters = psutil.net_io_counters()
-	prev_sent = prev_counters.bytes_sent
-	prev_recv = prev_counters.bytes_recv
-	prev_time = time.time()
+		self._prev_sent = curr_sent
+		self._prev_recv = curr_recv
+		self._prev_time = curr_time
 
-	logger.info(
-		f"[{my_name()}]💻 hw monitor on"
-	)
+	def _tick(self):
 
-	while True:
+		wt_start = time.time()
+		server	 = self.dashboard_server
 
 		try:
-			wt_start = time.time()
 
-			# Batch async operations with yield points between each
+			# psutil calls below are single syscalls / procfs reads
+			# returning in microseconds; only a blocking `cpu_percent`
+			# sample (duration > 0) is worth a thread-pool hop.
+
+			if self.cpu_duration <= 0:
+
+				# utilisation since the previous tick
+				server.cpu_load_percentage = psutil.cpu_percent(interval=None)
+
+			elif self._cpu_fut is None or self._cpu_fut.done():
+
+				# at most one blocking sample in flight: a duration at or
+				# above the tick interval must not pile up on the default
+				# executor shared with the flush/close paths
+
+				self._cpu_fut = self._loop.run_in_executor(
+					None, psutil.cpu_percent, self.cpu_duration,
+				)
+				self._cpu_fut.add_done_callback(self._set_cpu_load)
+
+			server.mem_load_percentage = psutil.virtual_memory().percent
+			server.storage_percentage  = psutil.disk_usage('/').percent
+
+			self._update_network_load()
+
+			if (
+				self._malloc_trim is not None
+				and wt_start - self._last_trim
+				>= self.MALLOC_TRIM_INTERVAL_SEC
+			):
+
+				# ctypes drops the GIL; keep the heap walk off the loop
+				self._last_trim = wt_start
+				self._loop.run_in_executor(None, self._malloc_trim, 0)
 
-			dashboard_server.cpu_load_percentage = await get_cpu_load()
-			await asyncio.sleep(0)
-			
-			dashboard_server.mem_load_percentage = await get_memory_load()
-			await asyncio.sleep(0)
-			
-			dashboard_server.storage_percentage = await get_storage_load()
-			await asyncio.sleep(0)
-			
-			(
-				dashboard_server.network_load_mbps,
-				prev_sent, prev_recv, prev_time,
-			) = await get_network_load(
-				prev_sent, prev_recv, prev_time
-			)
-			await asyncio.sleep(0)
-			
 		except Exception as e:
 
-			logger.error(
+			self.logger.error(
 				f"[{my_name()}] Error monitoring hardware: {e}",
 				exc_info=True,
 			)
-			await asyncio.sleep(0)
 
 		finally:
 
-			sleep_duration = max(
-				0.0,
-				(
-					hardware_monitoring_interval 
-					- (time.time() - wt_start)
-				),
+			self._handle = self._loop.call_later(
+				max(0.0, self.interval - (time.time() - wt_start)),
+				self._tick,
 			)
-			await asyncio.sleep(sleep_duration)
 
 #———————————————————————————————————————————————————————————————————————————————
 
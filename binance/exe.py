@@ -3,21 +3,24 @@
 #———————————————————————————————————————————————————————————————————————————————
 
 from util import (
+	BoundedRecordSet,
 	CMAP4TXT, RESET4TXT,
 	my_name,
 	get_ssl_context,
 	NanoTimer,
-	ms_to_datetime,
+	utc_fields_from_ms,
 	update_shared_time_dict,
-	compute_bias_ms,
 	format_ws_url,
+	tune_ws_socket,
 	get_current_time_ms,
+	open_gzip_appender,
+	MERGE_ZIP_LEVEL,
+	enable_isal_for_zipfile,
+	copy_gzip_part,
 	get_cur_datetime_str,
 	elaborate_ws_peer,
-	get_global_log_queue,
 	get_subprocess_logger,
 	ensure_logging_on_exception,
-	force_print_exception,
 )
 
 from hotswap import (
@@ -28,18 +31,19 @@ from hotswap import (
 
 from latency import (
 	LatencyMonitor,
+	SortedLatencyDeque,
 )
 
-import sys, os, io, asyncio, orjson
+import os, asyncio, orjson
 import shutil, zipfile, logging
 import websockets, time
 import numpy as np
-import math, statistics
+import math, functools
 
 from io import TextIOWrapper
-from collections import OrderedDict, deque
+from collections import deque
 from typing import Optional
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import Future, ProcessPoolExecutor
 
 #———————————————————————————————————————————————————————————————————————————————
 #	 '2025-06-27_13-15'
@@ -59,128 +63,7 @@ def get_date_from_suffix(suffix: str) -> str:
 
 #———————————————————————————————————————————————————————————————————————————————
 
-def proc_zip_n_remove_jsonl(
-	chart_dir:	  str,
-	symbol_upper: str,
-	last_suffix:  str,
-	max_retries:  int   = 100,
-	retry_delay:  float = 0.1,
-	exp_backoff:  float = 1.2,
-):
-
-	#———————————————————————————————————————————————————————————————————————————
-
-	def zip_and_remove(src_path: str):
-
-		try:
-
-			zip_path = src_path.replace(".jsonl", ".zip")
-
-			current_retry_delay = retry_delay
-
-			# 🔧 Retry logic for zip creation with integrity verification
-
-			for attempt in range(max_retries):
-
-				try:
-
-					with zipfile.ZipFile(	# Create zip file
-						zip_path, "w",
-						zipfile.ZIP_DEFLATED
-					) as zf:
-
-						zf.write(src_path,
-							arcname=os.path.basename(src_path)
-						)
-
-					# Verify zip integrity immediately after creation
-
-					with zipfile.ZipFile(zip_path, "r") as test_zf:
-
-						test_zf.testzip()
-
-					break  # Success, exit retry loop
-
-				except (zipfile.BadZipFile, OSError, IOError) as e:
-
-					if attempt == max_retries - 1:
-
-						get_subprocess_logger().error(
-							f"[{my_name()}] "
-							f"Zip creation failed after "
-							f"{max_retries} attempts: "
-							f"{zip_path} → {e}",
-							exc_info = True,
-						)
-						raise
-
-					get_subprocess_logger().warning(
-						f"[{my_name()}] "
-						f"Zip creation not ready "
-						f"(attempt {attempt + 1}/{max_retries}): "
-						f"{zip_path}, retrying in {current_retry_delay}s..."
-					)
-
-					# Clean up partial zip file if it exists
-
-					try:
-
-						if os.path.exists(zip_path):
-
-							os.remove(zip_path)
-
-					except Exception:
-
-						pass
-
-					time.sleep(current_retry_delay)
-					current_retry_delay *= exp_backoff
-
-			# Remove source .jsonl file only after successful zip creation
-
-			os.remove(src_path)
-
-		except FileNotFoundError:
-
-			get_subprocess_logger().warning(
-				f"[{my_name()}] Source file not found "
-				f"somehow: {src_path}"
-			)
-
-		except Exception as e:
-			
-			get_subprocess_logger().error(
-				f"[{my_name()}] Failed to "
-				f"zip and remove {src_path}: {e}",
-				exc_info = True,
-			)
-			raise
-
-	#———————————————————————————————————————————————————————————————————————————
-
-	try:
-
-		last_jsonl_path = os.path.join(
-			os.path.join(
-				chart_dir, "temporary",
-				f"{symbol_upper}_execution_"
-				f"{get_date_from_suffix(last_suffix)}",
-			),
-			f"{symbol_upper}_execution_{last_suffix}.jsonl"
-		)
-
-		zip_and_remove(last_jsonl_path)
-
-	except Exception as e:
-
-		get_subprocess_logger().error(
-			f"[{my_name()}][{symbol_upper}] "
-			f"Failed to process {last_suffix}: {e}",
-			exc_info = True,
-		)
-		raise
-
-#———————————————————————————————————————————————————————————————————————————————
+COPY_CHUNK_SIZE = 1 << 20
 
 def proc_symbol_consolidate_a_day(
 	symbol:		 str,
@@ -198,14 +81,21 @@ def proc_symbol_consolidate_a_day(
 
 		logger = get_subprocess_logger()
 
+		# ISA-L deflate/CRC for the daily archive when installed
+
+		has_isal = enable_isal_for_zipfile()
+		record_size = 0							# JSONL: cut truncated parts at "\n"
+
 		# Construct working directories and target paths
 
 		tmp_dir = os.path.join(base_dir, "temporary",
 			f"{symbol.upper()}_execution_{day_str}"
 		)
 
-		merged_path = os.path.join(base_dir,
-			f"{symbol.upper()}_execution_{day_str}.jsonl"
+		merged_name = f"{symbol.upper()}_execution_{day_str}.jsonl"
+
+		final_zip = os.path.join(base_dir,
+			f"{symbol.upper()}_execution_{day_str}.zip"
 		)
 
 		if not os.path.isdir(tmp_dir):
@@ -218,31 +108,36 @@ def proc_symbol_consolidate_a_day(
 			return
 
 		#———————————————————————————————————————————————————————————————————————
-		# List all zipped minute-level files (may be empty)
+		# List all minute-level parts (may be empty):
+		#	.gz		written directly by the dump task
+		#	.zip	legacy per-minute archives from older runs
 		#———————————————————————————————————————————————————————————————————————
 
 		try:
 
-			zip_files = [
-				f for f in os.listdir(tmp_dir)
-				if f.endswith(".zip")
-			]
+			with os.scandir(tmp_dir) as it:
+
+				part_files = [
+					entry.name for entry in it
+					if entry.name.endswith((".gz", ".zip"))
+					and entry.is_file()
+				]
 
 		except Exception as e:
 
 			logger.error(
 				f"[{my_name()}][{symbol.upper()}] "
-				f"Failed to list zips in {tmp_dir}: {e}",
+				f"Failed to list parts in {tmp_dir}: {e}",
 				exc_info = True,
 			)
 
 			return
 
-		if not zip_files:
+		if not part_files:
 
 			logger.error(
 				f"[{my_name()}][{symbol.upper()}] "
-				f"No zip files to merge on {day_str}."
+				f"No minute files to merge on {day_str}."
 			)
 
 			return
@@ -251,23 +146,61 @@ def proc_symbol_consolidate_a_day(
 		# File handle management with proper scope handling
 		#———————————————————————————————————————————————————————————————————————
 
-		fout = None
+		archive		= None
+		fout		= None
+		is_complete	= False
 
 		try:
 
-			# Open output file for merged .jsonl content
+			# Stream every part straight into the single archive member
+			# (byte-exact concatenation); no merged file is staged on disk
 
-			fout = open(merged_path, "w", encoding="utf-8")
+			archive = zipfile.ZipFile(final_zip, "w", zipfile.ZIP_DEFLATED,
+				compresslevel = MERGE_ZIP_LEVEL,
+			)
+			fout	= archive.open(merged_name, "w", force_zip64 = True)
 
 			# Initialize current_retry_delay as local variable
 
 			current_retry_delay = retry_delay
 
-			# Process each zip file in chronological order
+			# Process each minute file in chronological order
+
+			for part_file in sorted(part_files):
+
+				zip_path = os.path.join(tmp_dir, part_file)
+
+				# Gzip parts are closed before the merge is submitted
+
+				if part_file.endswith(".gz"):
 
-			for zip_file in sorted(zip_files):
+					try:
+
+						dropped = copy_gzip_part(
+							zip_path, fout, record_size,
+							COPY_CHUNK_SIZE, has_isal,
+						)
+
+						if dropped is not None:	# truncated by a hard kill
+
+							logger.warning(
+								f"[{my_name()}][{symbol.upper()}] "
+								f"Truncated part cut to its last whole "
+								f"record ({dropped} bytes dropped): "
+								f"{zip_path}"
+							)
 
-				zip_path = os.path.join(tmp_dir, zip_file)
+					except Exception as e:
+
+						logger.error(
+							f"[{my_name()}][{symbol.upper()}]\n"
+							f"Failed to extract {zip_path}: {e}",
+							exc_info = True,
+						)
+
+						return
+
+					continue
 
 				# Wait for zip file to be fully ready
 				
@@ -310,8 +243,7 @@ def proc_symbol_consolidate_a_day(
 					with zipfile.ZipFile(zip_path, "r") as zf:
 						for member in zf.namelist():
 							with zf.open(member) as f:
-								for raw in f:
-									fout.write(raw.decode("utf-8"))
+								shutil.copyfileobj(f, fout, COPY_CHUNK_SIZE)
 
 				except Exception as e:
 
@@ -323,12 +255,14 @@ def proc_symbol_consolidate_a_day(
 
 					return
 
+			is_complete = True
+
 		except Exception as e:
 
 			logger.error(
 				f"[{my_name()}][{symbol.upper()}] "
-				f"Failed to open or write to merged file "
-				f"{merged_path}: {e}",
+				f"Failed to write merged archive "
+				f"{final_zip}: {e}",
 				exc_info = True,
 			)
 
@@ -336,75 +270,38 @@ def proc_symbol_consolidate_a_day(
 
 		finally:
 
-			# 🔧 Ensure the output file is properly closed
+			# 🔧 Member first (writes its header), then the central directory
+
+			for fh in (fout, archive):
 
-			if fout:
+				if fh is None: continue
 
 				try:
 
-					fout.close()
+					fh.close()
 
 				except Exception as close_error:
 
+					is_complete = False
+
 					logger.error(
 						f"[{my_name()}][{symbol.upper()}] "
-						f"Failed to close output file: "
+						f"Failed to close merged archive: "
 						f"{close_error}",
 						exc_info = True,
 					)
 
-		#———————————————————————————————————————————————————————————————————————
-		# Recompress the consolidated .jsonl
-		# into a final single-archive zip
-		#———————————————————————————————————————————————————————————————————————
+			# Never leave a half-written daily archive behind
 
-		try:
+			if not is_complete:
 
-			final_zip = merged_path.replace(".jsonl", ".zip")
+				try: os.remove(final_zip)
+				except OSError: pass
 
-			with zipfile.ZipFile(
-				final_zip, "w",
-				zipfile.ZIP_DEFLATED
-			) as zf:
-
-				zf.write(
-					merged_path,
-					arcname = os.path.basename(merged_path),
-				)
-
-		except Exception as e:
-
-			logger.error(
-				f"[{my_name()}][{symbol.upper()}] "
-				f"Failed to compress merged "
-				f"file on {day_str}: {e}",
-				exc_info = True,
-			)
-
-			# Do not remove .jsonl if compression failed
-
-			return
-
-		# Remove intermediate plain-text .jsonl file
-		# after compression
-
-		try:
-
-			if os.path.exists(merged_path):
-
-				os.remove(merged_path)
-
-		except Exception as e:
-
-			logger.error(
-				f"[{my_name()}][{symbol.upper()}] "
-				f"Failed to remove merged .jsonl "
-				f"on {day_str}: {e}",
-				exc_info = True,
-			)
+		if not is_complete: return
 
 		# Optionally delete the original temp folder
-		# containing per-minute zips
+		# containing per-minute parts
 
 		if purge:
 
@@ -423,8 +320,9 @@ def proc_symbol_consolidate_a_day(
 
 		logger.info(
 			f"[{my_name()}][{symbol.upper()}] "
-			f"Successfully merged {len(zip_files)} files "
-			f"for {day_str} (took {timer.tock():.5f} sec)."
+			f"Successfully merged {len(part_files)} files "
+			f"for {day_str} (took {timer.tock():.5f} sec"
+			f"{', isal' if has_isal else ''})."
 		)
 
 #———————————————————————————————————————————————————————————————————————————————
@@ -440,11 +338,10 @@ async def symbol_dump_execution(
 	save_intv_monitor:		dict[str, deque[int]],
 	purge_on_date_change:	int,
 	merge_executor:			ProcessPoolExecutor,	# rollover (fire-and-forgat)
-	znr_executor:			ProcessPoolExecutor,	# rollover (fire-and-forgat)
 	records_max:			int,
 	logger:					logging.Logger,
 	shutdown_event:			asyncio.Event,
-	file_sync_delay_sec:	float = 0.0005,
+	batch_max:				int	  = 256,			# records per write
 	#———————————————————————————————————————————————————————————————————————————
 ):
 
@@ -499,10 +396,7 @@ async def symbol_dump_execution(
 
 		try:
 
-			json_writer = open(
-				file_path, "a",
-				encoding = "utf-8",
-			)
+			json_writer = open_gzip_appender(file_path)
 
 		except OSError as e:
 
@@ -573,6 +467,8 @@ async def symbol_dump_execution(
 
 	#———————————————————————————————————————————————————————————————————————————
 
+	suffix_cache: list = [None, None]		# [bucket, suffix]
+
 	def get_file_suffix(
 		#———————————————————————————————————————————————————————————————————————
 		interval_min: int,
@@ -582,15 +478,30 @@ async def symbol_dump_execution(
 
 		try:
 
-			ts = ms_to_datetime(event_ts_ms)
+			# the suffix only changes once per bucket (minute or day)
+
+			bucket = event_ts_ms // (
+				60_000 if interval_min < 1440 else 86_400_000
+			)
+
+			if bucket == suffix_cache[0]:
+
+				return suffix_cache[1]
+
+			y, mo, d, hh, mm, _, _ = utc_fields_from_ms(event_ts_ms)
 
 			if interval_min < 1440:
 
-				return ts.strftime("%Y-%m-%d_%H-%M")
+				suffix = f"{y:04d}-{mo:02d}-{d:02d}_{hh:02d}-{mm:02d}"
 
 			else:
 
-				return ts.strftime("%Y-%m-%d")
+				suffix = f"{y:04d}-{mo:02d}-{d:02d}"
+
+			suffix_cache[0] = bucket
+			suffix_cache[1] = suffix
+
+			return suffix
 
 		except Exception as e:
 
@@ -636,6 +547,8 @@ async def symbol_dump_execution(
 
 	#———————————————————————————————————————————————————————————————————————————
 
+	last_temp_dir: list = [None]
+
 	async def gen_file_path(
 		#———————————————————————————————————————————————————————————————————————
 		symbol_upper: str,
@@ -647,16 +560,18 @@ async def symbol_dump_execution(
 		
 		try:
 
-			file_name = f"{symbol_upper}_execution_{suffix}.jsonl"
-			temp_dir  = os.path.join(chart_dir, "temporary",
-				f"{symbol_upper}_execution_{date_str}",
-			)
-			await asyncio.to_thread(
-				os.makedirs,
-				temp_dir,
-				exist_ok = True,
-			)
-			return os.path.join(temp_dir, file_name)
+			temp_dir = temp_dir_prefix + date_str
+
+			if temp_dir != last_temp_dir[0]:	# once per day
+
+				await asyncio.to_thread(
+					os.makedirs,
+					temp_dir,
+					exist_ok = True,
+				)
+				last_temp_dir[0] = temp_dir
+
+			return f"{temp_dir}{os.sep}{file_prefix}{suffix}.jsonl.gz"
 
 		except Exception as e:
 
@@ -672,7 +587,7 @@ async def symbol_dump_execution(
 	def flush_execution(
 		#———————————————————————————————————————————————————————————————————————
 		json_writer:		TextIOWrapper,
-		execution:			dict,
+		batch:				list[dict],
 		symbol:				str,
 		managed_fhndls:		dict[str, tuple[str, TextIOWrapper]],
 		save_intv_monitor:	dict[str, deque[int]],
@@ -701,16 +616,18 @@ async def symbol_dump_execution(
 
 					return (False, latest_json_flush)
 
-			json_writer.write(
-				orjson.dumps(execution).decode() + "\n"
-			)
-			json_writer.flush()
+			# one write per wakeup: the drained batch is encoded to
+			# bytes and joined, no str decode + re-encode per record
 
-			cur_time_ms = get_current_time_ms()
+			json_writer.write(b"".join([
+				json_dumps(execution, option = opt_append_newline)
+				for execution in batch
+			]))
+			# no per-record flush: see `flush_file_handles_periodically`
 
-			save_intv_monitor[symbol].append(
-				cur_time_ms - latest_json_flush
-			)
+			cur_time_ms = now_ms()
+
+			save_intv_append(cur_time_ms - latest_json_flush)
 			
 			latest_json_flush = cur_time_ms
 
@@ -748,8 +665,7 @@ async def symbol_dump_execution(
 
 	def memorize_treated(
 		#———————————————————————————————————————————————————————————————————————
-		records:	 OrderedDict[str, None],
-		records_max: int,
+		records:	 BoundedRecordSet,
 		symbol:		 str,
 		to_rec:		 str,
 		#———————————————————————————————————————————————————————————————————————
@@ -757,10 +673,8 @@ async def symbol_dump_execution(
 
 		try:
 
-			# discard the oldest at the front of the container
-			if len(records) >= records_max:
-				records.popitem(last = False)
-			records[to_rec] = None
+			# the oldest entry is discarded once `records_max` is reached
+			records.add(to_rec)
 
 		except Exception as e:
 
@@ -769,15 +683,47 @@ async def symbol_dump_execution(
 				f"for symbol='{symbol}', to_rec='{to_rec}': {e}"
 			) from e
 
+	#———————————————————————————————————————————————————————————————————————————
+	# Runs on the pool's management thread, not the event loop: only a
+	# GIL-atomic `set.discard` and a thread-safe log call happen here.
+	#———————————————————————————————————————————————————————————————————————————
+
+	def on_merge_done(
+		date: str,
+		fut:  Future,
+	):
+
+		inflight_merges.discard(date)
+
+		if not fut.cancelled() and fut.exception() is not None:
+
+			logger.error(
+				f"[{my_name()}][{symbol_upper}] "
+				f"merge for {date} failed: {fut.exception()!r}"
+			)
+
 	#———————————————————————————————————————————————————————————————————————————
 
 	queue				= executions_queue_dict[symbol]
 	symbol_upper		= symbol.upper()
+	file_prefix			= f"{symbol_upper}_execution_"
+	temp_dir_prefix		= os.path.join(chart_dir, "temporary", file_prefix)
 	latest_json_flush	= get_current_time_ms()
-	merged_dates_record = OrderedDict()
-	znr_minutes_record	= OrderedDict()
+	merged_dates_record = BoundedRecordSet(records_max)
+	inflight_merges		= set()		# dates submitted, not yet finished
+
+	# per-record helpers as closure cells: no global/attribute lookups
+	# inside `flush_execution()`
+
+	json_dumps		   = orjson.dumps
+	opt_append_newline = orjson.OPT_APPEND_NEWLINE
+	now_ms			   = get_current_time_ms
+	save_intv_append   = save_intv_monitor[symbol].append
 	
 	last_execution_time_ms = None		# checks timestamp order reversal
+	file_path = None
+
+	carry = None						# next minute's first execution
 
 	try:
 
@@ -785,7 +731,13 @@ async def symbol_dump_execution(
 
 			#———————————————————————————————————————————————————————————————————
 
-			execution = await fetch_execution(queue, symbol)
+			if carry is not None:
+
+				execution, carry = carry, None
+
+			else:
+
+				execution = await fetch_execution(queue, symbol)
 			
 			if execution is None:
 				logger.critical(
@@ -807,19 +759,6 @@ async def symbol_dump_execution(
 				)
 				continue
 
-			file_path = await gen_file_path(
-				symbol_upper, suffix,
-				chart_dir, date_str,
-			)
-			
-			if file_path is None:
-				logger.critical(
-					f"[{my_name()}][{symbol_upper}] "
-					f"file path is None, "
-					f"skipping iteration."
-				)
-				continue
-
 			#───────────────────────────────────────────────────────────────────
 			# STEP 1: Roll-over by Minute
 			#───────────────────────────────────────────────────────────────────
@@ -839,11 +778,34 @@ async def symbol_dump_execution(
 
 			if last_suffix != suffix:
 
+				# directory + path only change on rollover
+
+				file_path = await gen_file_path(
+					symbol_upper, suffix,
+					chart_dir, date_str,
+				)
+
+				if file_path is None:
+					logger.critical(
+						f"[{my_name()}][{symbol_upper}] "
+						f"file path is None, "
+						f"skipping iteration."
+					)
+					continue
+
 				if json_writer:							# if not the first flush
 
 					# ──────────────────────────────────────────────────────────
+					# close() drains up to a full write buffer to disk;
+					# keep that off the event loop. Unpublish the handle
+					# first so the periodic flush cannot touch it mid-close.
+					# ──────────────────────────────────────────────────────────
+
+					managed_fhndls.pop(symbol, None)
 
-					if not safe_close_jsonl(json_writer):
+					if not await asyncio.to_thread(
+						safe_close_jsonl, json_writer,
+					):
 
 						logger.warning(
 							f"[{my_name()}][{symbol.upper()}] "
@@ -853,26 +815,6 @@ async def symbol_dump_execution(
 
 					del json_writer
 
-					# ──────────────────────────────────────────────────────────
-					# fire and forget
-					# ──────────────────────────────────────────────────────────
-
-					await asyncio.sleep(file_sync_delay_sec)
-
-					if last_suffix not in znr_minutes_record:
-
-						memorize_treated(
-							znr_minutes_record,
-							records_max,
-							symbol, last_suffix,
-						)
-
-						znr_executor.submit(# pickle
-							proc_zip_n_remove_jsonl,
-							chart_dir, symbol_upper, 
-							last_suffix,
-						)
-
 				# ──────────────────────────────────────────────────────────────
 
 				try: 
@@ -894,7 +836,7 @@ async def symbol_dump_execution(
 
 			#───────────────────────────────────────────────────────────────────
 			# STEP 2: Check for day rollover and trigger merge
-			# At this point, ALL previous files are guaranteed to be .zip
+			# At this point, ALL previous files are closed .gz parts
 			#───────────────────────────────────────────────────────────────────
 
 			try:
@@ -906,19 +848,23 @@ async def symbol_dump_execution(
 					last_date = get_date_from_suffix(last_suffix)
 
 					if ((last_date != date_str) and 
-						(last_date not in merged_dates_record)
+						(last_date not in merged_dates_record) and
+						(last_date not in inflight_merges)
 					):
 
 						memorize_treated(
 							merged_dates_record,
-							records_max,
 							symbol, last_date,
 						)
 						
+						inflight_merges.add(last_date)
+
 						merge_executor.submit(	# pickle
 							proc_symbol_consolidate_a_day,
 							symbol, last_date, chart_dir,
 							purge = (purge_on_date_change == 1),
+						).add_done_callback(
+							functools.partial(on_merge_done, last_date)
 						)
 
 						logger.info(
@@ -946,23 +892,42 @@ async def symbol_dump_execution(
 				del date_str, last_suffix
 
 			#───────────────────────────────────────────────────────────────────
-			# STEP 3: Write execution to file and update flush intervals
+			# STEP 3: Drain what else is queued for the same file (up to
+			# `batch_max`), write it in one go and update flush intervals.
+			# An execution of the next minute is carried to the next wakeup,
+			# which rolls the file over first.
 			#───────────────────────────────────────────────────────────────────
 
-			if last_execution_time_ms is not None:
+			batch = [execution]
+
+			while len(batch) < batch_max:
+
+				try: pending = queue.get_nowait()
+				except asyncio.QueueEmpty: break
+
+				if get_file_suffix(
+					save_interval_min, pending["recv_ms"],
+				) != suffix:
+
+					carry = pending
+					break
+
+				batch.append(pending)
+
+			for pending in batch:
 
 				if (
-					execution["recv_ms"]
-					< last_execution_time_ms
+					last_execution_time_ms is not None
+					and pending["recv_ms"] < last_execution_time_ms
 				):
 
 					logger.critical(
 						f"[{my_name()}] "
 						f"execution timestamp order reversed: "
-						f"{execution['recv_ms']} < {last_execution_time_ms}"
+						f"{pending['recv_ms']} < {last_execution_time_ms}"
 					)
 
-			last_execution_time_ms = execution["recv_ms"]
+				last_execution_time_ms = pending["recv_ms"]
 
 			(
 				#───────────────────────────────────────────────────────────────
@@ -972,7 +937,7 @@ async def symbol_dump_execution(
 			) = flush_execution(
 				#───────────────────────────────────────────────────────────────
 				json_writer,
-				execution,
+				batch,
 				symbol,
 				managed_fhndls,
 				save_intv_monitor,
@@ -991,7 +956,7 @@ async def symbol_dump_execution(
 
 			# await asyncio.sleep(1)		# when simulating some delays
 
-			del execution, file_path, is_success
+			del execution, batch, is_success
 
 	except asyncio.CancelledError:
 
@@ -1140,7 +1105,7 @@ async def put_execution(				# @aggTrade
 		try:
 
 			since_the_latest_sleep = (
-				time.time() - shared_time_dict[shared_time_dict_key]
+				time.monotonic() - shared_time_dict[shared_time_dict_key]
 			)
 
 			if (
@@ -1174,7 +1139,9 @@ async def put_execution(				# @aggTrade
 		last_recv_time_ns:		  Optional[float],
 	) -> Optional[float]:
 
-		websocket_recv_intv_stat['p90'] = None
+		websocket_recv_intv_stat['p90']		= None
+		websocket_recv_intv_stat['timeout'] = None
+		websocket_recv_intv_stat['n_new']	= 0
 		websocket_recv_interval.clear()
 		last_recv_time_ns = None
 		
@@ -1190,29 +1157,49 @@ async def put_execution(				# @aggTrade
 		minimum:		float,
 		*,
 		max_cap:		float	= 10.0,
+		refresh_div:	int		= 10,
 	) -> float:			# ws_timeout_sec (adaptive based on statistics)
-		
-		finite = [
-			x for x in data 
-			if (
-				math.isfinite(x)
-				and x >= 0.0
-			)
-		]
 
-		if len(finite) >= data.maxlen:
-			
-			p90 = float(np.percentile(finite, 90))
+		if len(data) < data.maxlen:		# O(1) until the window is full
+
+			stat['p90'] = None
+			return max(default, minimum)
+
+		# Called once per frame, but the p90 of a full window only moves
+		# once a fair share of it is new: rescan every 1/refresh_div of
+		# the window and serve the cached timeout in between.
+
+		if (
+			stat['timeout'] is not None
+			and stat['n_new'] < data.maxlen // refresh_div
+		):
+
+			stat['n_new'] += 1
+			return stat['timeout']
+
+		stat['n_new'] = 0
+
+		# one C-level pass: copy, mask, then a linear-time selection
+		# (nearest-rank p90, no interpolation needed for a timeout)
+
+		arr	   = np.fromiter(data, dtype = np.float64, count = len(data))
+		finite = arr[np.isfinite(arr) & (arr >= 0.0)]
+
+		if finite.size >= data.maxlen:
+
+			k	= int(0.9 * (finite.size - 1))
+			p90 = float(np.partition(finite, k)[k])
 			stat['p90'] = p90
 			cand = max(p90 * multiplier, minimum)
 			
-			return min(cand, max_cap)
+			stat['timeout'] = min(cand, max_cap)
 			
 		else:
 			
-			
 			stat['p90'] = None
-			return max(default, minimum)
+			stat['timeout'] = max(default, minimum)
+
+		return stat['timeout']
 
 	#———————————————————————————————————————————————————————————————————————————
 	# Howswap State
@@ -1240,7 +1227,11 @@ async def put_execution(				# @aggTrade
 	ws_timeout_sec = ws_timeout_default_sec
 	last_recv_time_ns = None
 	
-	websocket_recv_intv_stat: dict[str, float | None] = {"p90": None}
+	websocket_recv_intv_stat: dict[str, float | None] = {
+		"p90":	   None,
+		"timeout": None,		# cached result of `update_ws_recv_timeout`
+		"n_new":   0,			# samples since the last rescan
+	}
 	websocket_recv_interval:  deque[float] = deque(
 		maxlen = (
 			len(symbols) *
@@ -1263,13 +1254,32 @@ async def put_execution(				# @aggTrade
 	# Latency Estimation
 	#———————————————————————————————————————————————————————————————————————————
 
-	latency_dict: dict[str, deque[int]] = {}
+	latency_dict: dict[str, SortedLatencyDeque] = {}
 	latency_dict.clear()
 	latency_dict.update({
-		symbol: deque(maxlen = lat_mon.deque_sz)
+		symbol: SortedLatencyDeque(maxlen = lat_mon.deque_sz)
 		for symbol in symbols
 	})
 
+	n_full_windows = 0		# symbols whose latency window is full
+
+	#———————————————————————————————————————————————————————————————————————————
+	# One dict hit per incoming frame: `<symbol>@aggTrade` → symbol
+	#———————————————————————————————————————————————————————————————————————————
+
+	stream_to_symbol: dict[str, str] = {
+		f"{symbol}@aggTrade": symbol
+		for symbol in symbols
+	}
+
+	symbol_set: frozenset[str] = frozenset(symbols)
+
+	json_loads = orjson.loads	# local name: LOAD_FAST in the frame loop
+
+	#———————————————————————————————————————————————————————————————————————————
+
+	ws_url_cache: dict[str, tuple[str, str]] = {}	# port → (url, url_to_prt)
+
 	#———————————————————————————————————————————————————————————————————————————
 
 	while not hotswap_manager.is_shutting_down():	# infinite standalone loop
@@ -1287,10 +1297,23 @@ async def put_execution(				# @aggTrade
 					ports_stream_binance_com,
 				)
 
-			ws_url_complete = ws_url[ws_url_key].replace(
-				wildcard_stream_binance_com_port,
-				target_port,
-			)
+			# Ports cycle through a short fixed list: build each URL and
+			# its coloured log form once, then reuse them on reconnect.
+
+			cached_url = ws_url_cache.get(target_port)
+
+			if cached_url is None:
+
+				url = ws_url[ws_url_key].replace(
+					wildcard_stream_binance_com_port,
+					target_port,
+				)
+				cached_url = ws_url_cache[target_port] = (
+					url,
+					format_ws_url(url, symbols, ports_stream_binance_com),
+				)
+
+			ws_url_complete, ws_url_to_prt = cached_url
 
 			#———————————————————————————————————————————————————————————————————
 			# Within WebSocket
@@ -1301,7 +1324,8 @@ async def put_execution(				# @aggTrade
 				ssl			  = get_ssl_context(),
 				ping_interval = ws_ping_interval,
 				ping_timeout  = ws_ping_timeout,
-				compression	  = None,
+				compression	  = None,		# Binance frames are uncompressed
+				max_queue	  = 16,			# backpressure, not unbounded buffering
 			) as ws:
 
 				#———————————————————————————————————————————————————————————————
@@ -1313,6 +1337,8 @@ async def put_execution(				# @aggTrade
 					shared_time_dict_key,
 				)	# upon successful ws (re)connection
 
+				tune_ws_socket(ws)
+
 				ws_retry_cnt = 0
 				ws_start_time = time.time()
 
@@ -1322,12 +1348,6 @@ async def put_execution(				# @aggTrade
 					last_recv_time_ns,
 				)
 
-				ws_url_to_prt = format_ws_url(
-					ws_url_complete,
-					symbols,
-					ports_stream_binance_com,
-				)
-				
 				await elaborate_ws_peer(
 					websocket_peer,
 					ws.remote_address,
@@ -1576,7 +1596,9 @@ async def put_execution(				# @aggTrade
 						# Receive a Message or Shutting Down
 						#———————————————————————————————————————————————————————
 						
-						recv_task	  = asyncio.create_task(ws.recv())
+						recv_task	  = asyncio.create_task(
+							ws.recv(decode = False)	# bytes → orjson
+						)
 						shutdown_task = asyncio.create_task(
 							shutdown_event.wait()
 						)
@@ -1609,39 +1631,25 @@ async def put_execution(				# @aggTrade
 
 						try:
 
-							msg = orjson.loads(raw)
+							msg = json_loads(raw)
 
 							#———————————————————————————————————————————————————
 							# Validate `stream` Field
 							#———————————————————————————————————————————————————
 
-							stream = msg.get("stream", "")
-							split  = stream.split("@")
-
-							if len(split) != 2:
+							stream = msg["stream"]
 
-								raise ValueError(
-									f"unexpected "
-									f"stream: {stream}"
-								)
+							# Binance stream names are lowercase by contract,
+							# so the full stream name is the lookup key.
 
-							if split[1] != "aggTrade":
-
-								raise ValueError(
-									f"expected `aggTrade` but"
-									f"received {split[1]}; "
-								)
+							cur_symbol = stream_to_symbol.get(stream)
 
-							cur_symbol = (
-								split[0]
-								or "UNKNOWN"
-							).lower()
+							if cur_symbol is None:
 
-							if cur_symbol not in symbols:
+								cur_symbol = "UNKNOWN"
 
 								raise ValueError(
-									f"unexpected "
-									f"symbol: {cur_symbol.upper()}"
+									f"unexpected stream: {stream}"
 								)
 
 							#———————————————————————————————————————————————————
@@ -1649,23 +1657,20 @@ async def put_execution(				# @aggTrade
 							# 	https://tinyurl.com/BinanceWsAggTrade
 							#———————————————————————————————————————————————————
 
-							data = msg.get("data", {})
+							try:
+
+								data = msg["data"]
 
-							event_time = data.get("E")
-							price	   = data.get("p")
-							quantity   = data.get("q")
-							is_maker   = data.get("m")
+								event_time = data["E"]
+								price	   = data["p"]
+								quantity   = data["q"]
+								is_maker   = data["m"]
 
-							if (
-								(event_time is None)
-								or (price is None)
-								or (quantity is None)
-								or (is_maker is None)
-							):
+							except KeyError as e:
 
 								raise ValueError(
-									f"missing fields @data"
-								)
+									f"missing {e} @data"
+								) from None
 
 							if	 (is_maker == True):  is_maker = '1'
 							elif (is_maker == False): is_maker = '0'
@@ -1685,13 +1690,16 @@ async def put_execution(				# @aggTrade
 							# Estimate Latency
 							#———————————————————————————————————————————————————————
 
-							cur_time_ms = get_current_time_ms()
+							cur_time_ns = time.time_ns()	# one clock read per frame
+							cur_time_ms = cur_time_ns // 1_000_000
 
 							latency_ms = (
 								cur_time_ms - event_time
 							)
 
-							latency_dict[cur_symbol].append(latency_ms)
+							if latency_dict[cur_symbol].append(latency_ms):
+
+								n_full_windows += 1
 
 							#———————————————————————————————————————————————————————
 							# Backup discards ws messages until it becomes main
@@ -1705,41 +1713,26 @@ async def put_execution(				# @aggTrade
 							# Latency Statistics
 							#———————————————————————————————————————————————————————
 
-							lat_mon.latency[cur_symbol] = int(
-								statistics.median(
-									latency_dict[cur_symbol]
-								)
+							lat_mon.update_latency(
+								cur_symbol,
+								int(latency_dict[cur_symbol].median())
 							)
 
-							if lat_mon.latency[cur_symbol] is None:
-
-								continue
-
 							oneway_network_latency_ms = max(
-								0, lat_mon.latency.get(cur_symbol, 0)
+								0, lat_mon.latency[cur_symbol]
 							)
 
 							#———————————————————————————————————————————————————————
 
-							if all(
-								lat_mon.latency[s] is not None
-								for s in symbols
-							):
+							if lat_mon.all_known():
 
-								if all(
-									lat_mon.latency[s] < lat_mon.thrs_ms
-									for s in symbols
-								):
+								if lat_mon.all_below():
 
-									lat_mon.evnt_ok_.set()
+									lat_mon.set_ok()
 								
-								elif all(
-									len(latency_dict[s])
-									>= latency_dict[s].maxlen
-									for s in symbols
-								):
+								elif n_full_windows == len(symbols):
 
-									lat_mon.evnt_ok_.clear()
+									lat_mon.clear_ok()
 									
 							#———————————————————————————————————————————————————————
 
@@ -1780,8 +1773,6 @@ async def put_execution(				# @aggTrade
 							# Statistics on WebSocket Receipt Interval
 							#———————————————————————————————————————————————————————
 
-							cur_time_ns = time.time_ns()
-
 							if last_recv_time_ns is not None:
 								
 								websocket_recv_interval.append(
@@ -1806,7 +1797,7 @@ async def put_execution(				# @aggTrade
 
 							sym = (
 								cur_symbol
-								if cur_symbol in symbols
+								if cur_symbol in symbol_set
 								else "UNKNOWN"
 							)
 							logger.warning(
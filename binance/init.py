@@ -3,14 +3,14 @@
 #———————————————————————————————————————————————————————————————————————————————
 
 import logging, asyncio
-from collections import OrderedDict, deque
+from collections import deque
 from io import TextIOWrapper
 from typing import Optional
 
 from util import(
 	my_name,
 	resource_path,
-	get_current_time_ms,
+	ConflatingQueue,
 )
 
 from latency import (
@@ -26,8 +26,11 @@ def setup_uvloop(
 
 	try:
 
+		# Probe only: `main.py` starts the loop with `uvloop.run()`,
+		# which builds a `uvloop.Loop` directly, so no global policy
+		# is installed for other imports to override.
+
 		import uvloop
-		asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 		to_prt = f"[{my_name()}]⚡ uvloop"
 		if logger:	  logger.info(to_prt)
@@ -43,7 +46,7 @@ def setup_uvloop(
 		)
 		if logger:	  logger.warning(to_prt)
 		elif verbose: print(to_prt, flush = True)
-		pass
+		return False
 
 	except Exception as e:
 
@@ -76,6 +79,9 @@ def load_config(
 	#
 	int,			# purge_on_date_change
 	int,			# save_interval_min
+	str,			# lob_persist_format
+	float,			# file_flush_interval_sec
+	int,			# main_cpu_core
 	#
 	int,			# snapshots_queue_max
 	int,			# executions_queue_max
@@ -119,7 +125,7 @@ def load_config(
 
 			return list(
 				# the input order is preserved
-				OrderedDict.fromkeys(
+				dict.fromkeys(
 					s.lower()
 					for s in val_str.split(",")
 					if s.strip()
@@ -150,7 +156,7 @@ def load_config(
 					f"missing or not a string."
 				)
 
-			return list(OrderedDict.fromkeys(
+			return list(dict.fromkeys(
 				s.lower()
 				for s in symbols_str.split(",")
 				if s.strip()
@@ -180,6 +186,9 @@ def load_config(
 		#
 		int,			# purge_on_date_change
 		int,			# save_interval_min
+		str,			# lob_persist_format
+		float,			# file_flush_interval_sec
+		int,			# main_cpu_core
 		#
 		int,			# snapshots_queue_max
 		int,			# executions_queue_max
@@ -223,6 +232,17 @@ def load_config(
 			save_interval_min	 = int(config.get("SAVE_INTERVAL_MIN"))
 			if save_interval_min > 1440:
 				raise ValueError("SAVE_INTERVAL_MIN must be ≤ 1440")
+			lob_persist_format = config.get(
+				"LOB_PERSIST_FORMAT", "jsonl"
+			).lower()
+			if lob_persist_format not in ("jsonl", "binary"):
+				raise ValueError("LOB_PERSIST_FORMAT must be jsonl|binary")
+			file_flush_interval_sec = float(config.get(
+				"FILE_FLUSH_INTERVAL_SEC", "1.0"
+			))
+			if file_flush_interval_sec <= 0:
+				raise ValueError("FILE_FLUSH_INTERVAL_SEC must be > 0")
+			main_cpu_core = int(config.get("MAIN_CPU_CORE", "-1"))
 
 			snapshots_queue_max	 = int(config.get("SNAPSHOTS_QUEUE_MAX"))
 			executions_queue_max = int(config.get("EXECUTIONS_QUEUE_MAX"))
@@ -264,6 +284,9 @@ def load_config(
 				#
 				purge_on_date_change,
 				save_interval_min,
+				lob_persist_format,
+				file_flush_interval_sec,
+				main_cpu_core,
 				#
 				snapshots_queue_max,
 				executions_queue_max,
@@ -342,6 +365,9 @@ def load_config(
 			#
 			purge_on_date_change,
 			save_interval_min,
+			lob_persist_format,
+			file_flush_interval_sec,
+			main_cpu_core,
 			#
 			snapshots_queue_max,
 			executions_queue_max,
@@ -419,6 +445,9 @@ def load_config(
 			#
 			purge_on_date_change,
 			save_interval_min,
+			lob_persist_format,
+			file_flush_interval_sec,
+			main_cpu_core,
 			#
 			snapshots_queue_max,
 			executions_queue_max,
@@ -460,7 +489,7 @@ def init_runtime_state(
 	#———————————————————————————————————————————————————————————————————————————
 	put_snapshot_interval:		dict[str, deque[int]],
 	#———————————————————————————————————————————————————————————————————————————
-	snapshots_queue_dict:		dict[str, asyncio.Queue],
+	snapshots_queue_dict:		dict[str, ConflatingQueue],
 	snapshots_queue_max:		int,
 	#———————————————————————————————————————————————————————————————————————————
 	executions_queue_dict:		dict[str, asyncio.Queue],
@@ -506,7 +535,7 @@ def init_runtime_state(
 
 		snapshots_queue_dict.clear()
 		snapshots_queue_dict.update({
-			symbol: asyncio.Queue(
+			symbol: ConflatingQueue(
 				maxsize = snapshots_queue_max
 			)
 			for symbol in symbols
@@ -22,17 +22,10 @@
 #———————————————————————————————————————————————————————————————————————————————
 
 import asyncio, logging
-import websockets, time, random, statistics, orjson
-import numpy as np
-from collections import deque
+from bisect import bisect_left, insort
 from typing import Optional
 from util import (
 	my_name,
-	get_ssl_context,
-	NanoTimer,
-	get_current_time_ms, 
-	format_ws_url,
-	ensure_logging_on_exception,
 )
 
 #———————————————————————————————————————————————————————————————————————————————
@@ -80,6 +73,126 @@ class LatencyMonitor:
 		self.evnt_1st_dom = asyncio.Event()
 		self.evnt_1st_exe = asyncio.Event()
 
+		# set on every edge of `evnt_ok_` or `all_known()`;
+		# `gate_streaming_by_latency` sleeps on it instead of polling
+
+		self.evnt_wake = asyncio.Event()
+
+		# cached counts over `self.latency`, kept in step by
+		# `update_latency` so that the per-message readiness checks
+		# do not scan every symbol
+
+		self.n_known = 0	# symbols with a median
+		self.n_below = 0	# symbols with median < thrs_ms
+
+	#———————————————————————————————————————————————————————————————————————————
+
+	def update_latency(self, symbol: str, latency_ms: int):
+
+		prev = self.latency[symbol]
+
+		if prev is None:
+
+			self.n_known += 1
+
+			if self.n_known == len(self.latency):
+
+				self.evnt_wake.set()
+
+		elif prev < self.thrs_ms:
+
+			self.n_below -= 1
+
+		if latency_ms < self.thrs_ms:
+
+			self.n_below += 1
+
+		self.latency[symbol] = latency_ms
+
+	def set_ok(self):
+
+		if not self.evnt_ok_.is_set():
+
+			self.evnt_ok_.set()
+			self.evnt_wake.set()
+
+	def clear_ok(self):
+
+		if self.evnt_ok_.is_set():
+
+			self.evnt_ok_.clear()
+			self.evnt_wake.set()
+
+	def all_known(self) -> bool:
+
+		return self.n_known == len(self.latency)
+
+	def all_below(self) -> bool:
+
+		return self.n_below == len(self.latency)
+
+#———————————————————————————————————————————————————————————————————————————————
+# Sliding-window median without re-sorting the window on every sample:
+# a preallocated ring keeps the arrival order (for eviction), while a
+# sorted list keeps the order statistics (for the median). `statistics.median`
+# over a deque copies and sorts the whole window on every call.
+#———————————————————————————————————————————————————————————————————————————————
+
+class SortedLatencyDeque:
+
+	def __init__(self, maxlen: int):
+
+		self.maxlen = maxlen
+		self._ring: list[int] = [0] * maxlen
+		self._head  = 0				# next slot to write
+		self._count = 0
+		self._sorted: list[int] = []
+
+	def __len__(self) -> int:
+
+		return self._count
+
+	def append(self, value: int) -> bool:
+
+		"""
+		Returns True only on the append that fills the window.
+		"""
+
+		head = self._head
+		just_filled = False
+
+		if self._count == self.maxlen:
+
+			oldest = self._ring[head]
+			del self._sorted[bisect_left(self._sorted, oldest)]
+
+		else:
+
+			self._count += 1
+			just_filled = (self._count == self.maxlen)
+
+		self._ring[head] = value
+		self._head = head + 1 if head + 1 < self.maxlen else 0
+		insort(self._sorted, value)
+
+		return just_filled
+
+	def median(self) -> Optional[float]:
+
+		"""
+		Same result as `statistics.median` over the window.
+		"""
+
+		n = len(self._sorted)
+
+		if n == 0: return None
+
+		mid = n >> 1
+
+		if n & 1: return self._sorted[mid]
+
+		return (self._sorted[mid - 1] + self._sorted[mid]) / 2
+
 #———————————————————————————————————————————————————————————————————————————————
 # LEGACY FUNCTIONS
 #———————————————————————————————————————————————————————————————————————————————
@@ -93,6 +206,8 @@ async def gate_streaming_by_latency(
 
 	has_logged_warmup = False
 
+	shutdown_waiter = asyncio.create_task(evnt_shutdown.wait())
+
 	while not evnt_shutdown.is_set():				# infinite standalone loop
 
 		#———————————————————————————————————————————————————————————————————————
@@ -101,11 +216,7 @@ async def gate_streaming_by_latency(
 
 			latency_passed	= lat_mon.evnt_ok_.is_set()
 			is_stream_on	= lat_mon.evnt_go_.is_set()
-			has_all_latency	= all(
-				lat_mon.latency[s]
-				is not None
-				for s in symbols
-			)
+			has_all_latency	= lat_mon.all_known()
 
 			if (
 				latency_passed
@@ -145,12 +256,30 @@ async def gate_streaming_by_latency(
 
 					lat_mon.evnt_go_.clear()
 
-			await asyncio.sleep(lat_mon.rouslsec)
+			#———————————————————————————————————————————————————————————————————
+			# Sleep until the latency state changes (or shutdown)
+			#———————————————————————————————————————————————————————————————————
+
+			wake_waiter = asyncio.create_task(lat_mon.evnt_wake.wait())
+
+			try:
+
+				await asyncio.wait(
+					(wake_waiter, shutdown_waiter),
+					return_when = asyncio.FIRST_COMPLETED,
+				)
+
+			finally:
+
+				wake_waiter.cancel()
+
+			lat_mon.evnt_wake.clear()
 
 		#———————————————————————————————————————————————————————————————————————
 
 		except asyncio.CancelledError:
 
+			shutdown_waiter.cancel()
 			raise # logging unnecessary
 
 		#———————————————————————————————————————————————————————————————————————
@@ -168,6 +297,8 @@ async def gate_streaming_by_latency(
 
 		#———————————————————————————————————————————————————————————————————————
 			
+	shutdown_waiter.cancel()
+
 	logger.info(
 		f"[{my_name()}] task ends"
 	)
@@ -3,20 +3,24 @@
 #———————————————————————————————————————————————————————————————————————————————
 
 from util import (
+	BoundedRecordSet,
+	ConflatingQueue,
 	CMAP4TXT, RESET4TXT,
 	my_name,
 	get_ssl_context,
 	NanoTimer,
-	ms_to_datetime,
+	utc_fields_from_ms,
 	update_shared_time_dict,
-	compute_bias_ms,
 	format_ws_url,
+	tune_ws_socket,
 	get_current_time_ms,
+	open_gzip_appender,
+	MERGE_ZIP_LEVEL,
+	enable_isal_for_zipfile,
+	copy_gzip_part,
 	get_cur_datetime_str,
-	get_global_log_queue,
 	get_subprocess_logger,
 	ensure_logging_on_exception,
-	force_print_exception,
 )
 
 from hotswap import (
@@ -29,161 +33,141 @@ from latency import (
 	LatencyMonitor,
 )
 
-import sys, os, io, asyncio, orjson
-import shutil, zipfile, logging
+import os, asyncio, orjson
+import shutil, zipfile, logging, struct
 import websockets, time
 import numpy as np
-import math
+import math, functools
 
 from io import TextIOWrapper
-from collections import OrderedDict, deque
+from collections import deque
 from typing import Optional
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import Future, ProcessPoolExecutor
 
 #———————————————————————————————————————————————————————————————————————————————
-#	 '2025-06-27_13-15'
-# -> '2025-06-27'
+# Optional binary persistence (LOB_PERSIST_FORMAT = binary)
 #———————————————————————————————————————————————————————————————————————————————
-
-def get_date_from_suffix(suffix: str) -> str:
-
-	try: return suffix.split("_")[0]
-
-	except Exception as e:
-
-		raise RuntimeError(
-			f"[{my_name()}] Failed to extract date "
-			f"from suffix '{suffix}': {e}"
-		) from e
-
+# Fixed-size little-endian records so that per-minute files can be
+# concatenated as-is by the daily merge. Within a record the book is laid
+# out as arrays (SoA): bid prices, bid quantities, ask prices, ask
+# quantities, each padded with NaN up to LOB_BINARY_LEVELS.
+#
+# Every opened part starts with one header of the same size (magic,
+# version, levels, symbol), so a part or a merged member is
+# self-describing and stays record-aligned. Read back with
+# `load_lob_binary`, which checks and strips the headers.
 #———————————————————————————————————————————————————————————————————————————————
 
-def proc_zip_n_remove_jsonl(
-	lob_dir:	  str,
-	symbol_upper: str,
-	last_suffix:  str,
-	max_retries:  int   = 100,
-	retry_delay:  float = 0.1,
-	exp_backoff:  float = 1.2,
-):
-
-	#———————————————————————————————————————————————————————————————————————————
-
-	def zip_and_remove(src_path: str):
-
-		try:
-
-			zip_path = src_path.replace(".jsonl", ".zip")
+LOB_BINARY_LEVELS = 20
 
-			current_retry_delay = retry_delay
+LOB_BINARY_RECORD = struct.Struct(f"<3q{4 * LOB_BINARY_LEVELS}d")
 
-			# 🔧 Retry logic for zip creation with integrity verification
+LOB_BINARY_DTYPE = np.dtype([
+	("recv_ms",		 "<i8"),
+	("net_delay_ms", "<i8"),
+	("intv_lag_ms",	 "<i8"),
+	("bid_px",		 "<f8", (LOB_BINARY_LEVELS,)),
+	("bid_qty",		 "<f8", (LOB_BINARY_LEVELS,)),
+	("ask_px",		 "<f8", (LOB_BINARY_LEVELS,)),
+	("ask_qty",		 "<f8", (LOB_BINARY_LEVELS,)),
+])
 
-			for attempt in range(max_retries):
-
-				try:
+LOB_FILE_EXT = {"jsonl": ".jsonl", "binary": ".bin"}
 
-					with zipfile.ZipFile(	# Create zip file
-						zip_path, "w",
-						zipfile.ZIP_DEFLATED
-					) as zf:
+LOB_BINARY_MAGIC   = b"RTDLOB\x00\x01"		# in the `recv_ms` slot
+LOB_BINARY_VERSION = 1
+LOB_BINARY_HEADER  = struct.Struct("<8sHH16s")	# magic, version, levels, symbol
 
-						zf.write(src_path,
-							arcname=os.path.basename(src_path)
-						)
+def pack_binary_header(symbol: str) -> bytes:
 
-					# Verify zip integrity immediately after creation
+	return LOB_BINARY_HEADER.pack(
+		LOB_BINARY_MAGIC, LOB_BINARY_VERSION, LOB_BINARY_LEVELS,
+		symbol.upper().encode("ascii"),
+	).ljust(LOB_BINARY_RECORD.size, b"\x00")
 
-					with zipfile.ZipFile(zip_path, "r") as test_zf:
+def load_lob_binary(
+	source: str | bytes,
+) -> tuple[str, np.ndarray]:
 
-						test_zf.testzip()
+	"""
+	Loads an inflated `.bin` part or an unzipped daily member (a path, or
+	the raw bytes) into a LOB_BINARY_DTYPE array, with the headers
+	stripped. Returns `(symbol, records)`; raises ValueError on a missing
+	or foreign header.
+	"""
 
-					break  # Success, exit retry loop
+	if isinstance(source, (bytes, bytearray, memoryview)):
+		records = np.frombuffer(source, dtype = LOB_BINARY_DTYPE)
+	else:
+		records = np.fromfile(source, dtype = LOB_BINARY_DTYPE)
 
-				except (zipfile.BadZipFile, OSError, IOError) as e:
+	magic	  = np.frombuffer(LOB_BINARY_MAGIC, dtype = "<i8")[0]
+	is_header = records["recv_ms"] == magic
 
-					if attempt == max_retries - 1:
+	if not records.size or not is_header[0]:
+		raise ValueError("not an RT-Data binary LOB stream")
 
-						get_subprocess_logger().error(
-							f"[{my_name()}] "
-							f"Zip creation failed after "
-							f"{max_retries} attempts: "
-							f"{zip_path} → {e}",
-							exc_info = True,
-						)
-						raise
+	symbols = set()
 
-					get_subprocess_logger().warning(
-						f"[{my_name()}] "
-						f"Zip creation not ready "
-						f"(attempt {attempt + 1}/{max_retries}): "
-						f"{zip_path}, retrying in {current_retry_delay}s..."
-					)
+	for header in records[is_header]:
 
-					# Clean up partial zip file if it exists
-
-					try:
-
-						if os.path.exists(zip_path):
+		_, version, levels, symbol = LOB_BINARY_HEADER.unpack_from(
+			header.tobytes()
+		)
 
-							os.remove(zip_path)
+		if (version, levels) != (LOB_BINARY_VERSION, LOB_BINARY_LEVELS):
+			raise ValueError(
+				f"unsupported header: version {version}, levels {levels}"
+			)
 
-					except Exception:
+		symbols.add(symbol.rstrip(b"\x00").decode("ascii"))
 
-						pass
+	if len(symbols) != 1:
+		raise ValueError(f"mixed symbols in one stream: {sorted(symbols)}")
 
-					time.sleep(current_retry_delay)
-					current_retry_delay *= exp_backoff
+	return symbols.pop(), records[~is_header]
 
-			# Remove source .jsonl file only after successful zip creation
+def pack_snapshot_binary(snapshot: dict) -> bytes:
 
-			os.remove(src_path)
+	n	 = LOB_BINARY_LEVELS
+	bids = snapshot["bids"][:n]
+	asks = snapshot["asks"][:n]
+	nb	 = (math.nan,) * (n - len(bids))
+	na	 = (math.nan,) * (n - len(asks))
 
-		except FileNotFoundError:
+	return LOB_BINARY_RECORD.pack(
+		snapshot["recv_ms"],
+		snapshot["net_delay_ms"],
+		snapshot["intv_lag_ms"],
+		*[p for p, _ in bids], *nb,
+		*[q for _, q in bids], *nb,
+		*[p for p, _ in asks], *na,
+		*[q for _, q in asks], *na,
+	)
 
-			get_subprocess_logger().warning(
-				f"[{my_name()}] Source file not found "
-				f"somehow: {src_path}"
-			)
+#———————————————————————————————————————————————————————————————————————————————
+#	 '2025-06-27_13-15'
+# -> '2025-06-27'
+#———————————————————————————————————————————————————————————————————————————————
 
-		except Exception as e:
-			
-			get_subprocess_logger().error(
-				f"[{my_name()}] Failed to "
-				f"zip and remove {src_path}: {e}",
-				exc_info = True,
-			)
-			raise
+def get_date_from_suffix(suffix: str) -> str:
 
-	#———————————————————————————————————————————————————————————————————————————
+	try: return suffix.split("_")[0]
 
-	try:
+	except Exception as e:
 
-		# get_subprocess_logger().warning(
-		# 	f"\tproc_zip_n_remove_jsonl() invoked"
-		# )
-
-		last_jsonl_path = os.path.join(
-			os.path.join(
-				lob_dir, "temporary",
-				f"{symbol_upper}_orderbook_"
-				f"{get_date_from_suffix(last_suffix)}",
-			),
-			f"{symbol_upper}_orderbook_{last_suffix}.jsonl"
-		)
+		raise RuntimeError(
+			f"[{my_name()}] Failed to extract date "
+			f"from suffix '{suffix}': {e}"
+		) from e
 
-		zip_and_remove(last_jsonl_path)
+#———————————————————————————————————————————————————————————————————————————————
 
-	except Exception as e:
+COPY_CHUNK_SIZE = 1 << 20
 
-		get_subprocess_logger().error(
-			f"[{my_name()}][{symbol_upper}] "
-			f"Failed to process {last_suffix}: {e}",
-			exc_info = True,
-		)
-		raise
+# `ConflatingQueue` evictions are logged at most this often per symbol
 
-#———————————————————————————————————————————————————————————————————————————————
+DROP_LOG_INTERVAL_MS = 60_000
 
 def proc_symbol_consolidate_a_day(
 	symbol:		 str,
@@ -201,14 +185,18 @@ def proc_symbol_consolidate_a_day(
 
 		logger = get_subprocess_logger()
 
+		# ISA-L deflate/CRC for the daily archive when installed
+
+		has_isal = enable_isal_for_zipfile()
+
 		# Construct working directories and target paths
 
 		tmp_dir = os.path.join(base_dir, "temporary",
 			f"{symbol.upper()}_orderbook_{day_str}"
 		)
 
-		merged_path = os.path.join(base_dir,
-			f"{symbol.upper()}_orderbook_{day_str}.jsonl"
+		final_zip = os.path.join(base_dir,
+			f"{symbol.upper()}_orderbook_{day_str}.zip"
 		)
 
 		if not os.path.isdir(tmp_dir):
@@ -221,117 +209,199 @@ def proc_symbol_consolidate_a_day(
 			return
 
 		#———————————————————————————————————————————————————————————————————————
-		# List all zipped minute-level files (may be empty)
+		# List all minute-level parts (may be empty):
+		#	.gz		written directly by the dump task
+		#	.zip	legacy per-minute archives from older runs
 		#———————————————————————————————————————————————————————————————————————
 
 		try:
 
-			zip_files = [
-				f for f in os.listdir(tmp_dir)
-				if f.endswith(".zip")
-			]
+			with os.scandir(tmp_dir) as it:
+
+				part_files = [
+					entry.name for entry in it
+					if entry.name.endswith((".gz", ".zip"))
+					and entry.is_file()
+				]
 
 		except Exception as e:
 
 			logger.error(
 				f"[{my_name()}][{symbol.upper()}] "
-				f"Failed to list zips in {tmp_dir}: {e}",
+				f"Failed to list parts in {tmp_dir}: {e}",
 				exc_info = True,
 			)
 
 			return
 
-		if not zip_files:
+		if not part_files:
 
 			logger.error(
 				f"[{my_name()}][{symbol.upper()}] "
-				f"No zip files to merge on {day_str}."
+				f"No minute files to merge on {day_str}."
 			)
 
 			return
 
+		#———————————————————————————————————————————————————————————————————————
+		# LOB_PERSIST_FORMAT may change across restarts within a day: each
+		# format gets its own archive member, since JSONL and binary records
+		# cannot share one stream. Legacy `.zip` parts are JSONL.
+		#———————————————————————————————————————————————————————————————————————
+
+		parts_by_ext: dict[str, list[str]] = {}
+
+		for part_file in sorted(part_files):
+
+			stem = part_file.removesuffix(".gz").removesuffix(".zip")
+			ext	 = os.path.splitext(stem)[1] or LOB_FILE_EXT["jsonl"]
+
+			parts_by_ext.setdefault(ext, []).append(part_file)
+
+		if len(parts_by_ext) > 1:
+
+			logger.warning(
+				f"[{my_name()}][{symbol.upper()}] "
+				f"Mixed part formats on {day_str} "
+				f"({', '.join(sorted(parts_by_ext))}): "
+				f"one archive member per format."
+			)
+
 		#———————————————————————————————————————————————————————————————————————
 		# File handle management with proper scope handling
 		#———————————————————————————————————————————————————————————————————————
 
-		fout = None
+		archive		= None
+		fout		= None
+		is_complete	= False
 
 		try:
 
-			# Open output file for merged .jsonl content
+			# Stream every part straight into its format's archive member
+			# (byte-exact concatenation); no merged file is staged on disk
 
-			fout = open(merged_path, "w", encoding="utf-8")
+			archive = zipfile.ZipFile(final_zip, "w", zipfile.ZIP_DEFLATED,
+				compresslevel = MERGE_ZIP_LEVEL,
+			)
 
 			# Initialize current_retry_delay as local variable
 
 			current_retry_delay = retry_delay
 
-			# Process each zip file in chronological order
+			for ext, ext_parts in sorted(parts_by_ext.items()):
 
-			for zip_file in sorted(zip_files):
+				merged_name = f"{symbol.upper()}_orderbook_{day_str}{ext}"
+				fout		= archive.open(merged_name, "w", force_zip64 = True)
 
-				zip_path = os.path.join(tmp_dir, zip_file)
+				# Truncated parts are cut back to whole lines or records
 
-				# Wait for zip file to be fully ready
-				
-				for attempt in range(max_retries):
+				record_size = (
+					LOB_BINARY_RECORD.size
+					if ext == LOB_FILE_EXT["binary"] else 0
+				)
 
-					try:
+				# Process each minute file in chronological order
 
-						# Test if file is a valid zip
+				for part_file in ext_parts:
 
-						with zipfile.ZipFile(zip_path, "r") as test_zf:
+					zip_path = os.path.join(tmp_dir, part_file)
 
-							test_zf.testzip()  # Verify zip integrity
+					# Gzip parts are closed before the merge is submitted
 
-						break  # Success, exit retry loop
-						
-					except (zipfile.BadZipFile, FileNotFoundError) as e:
+					if part_file.endswith(".gz"):
+
+						try:
+
+							dropped = copy_gzip_part(
+								zip_path, fout, record_size,
+								COPY_CHUNK_SIZE, has_isal,
+							)
 
-						if attempt == max_retries - 1:
+							if dropped is not None:	# truncated by a hard kill
+
+								logger.warning(
+									f"[{my_name()}][{symbol.upper()}] "
+									f"Truncated part cut to its last whole "
+									f"record ({dropped} bytes dropped): "
+									f"{zip_path}"
+								)
+
+						except Exception as e:
 
 							logger.error(
-								f"[{my_name()}][{symbol.upper()}] "
-								f"Zip file still invalid after "
-								f"{max_retries} attempts: "
-								f"{zip_path} → {e}"
+								f"[{my_name()}][{symbol.upper()}]\n"
+								f"Failed to extract {zip_path}: {e}",
+								exc_info = True,
 							)
+
 							return
+
+						continue
+
+					# Wait for zip file to be fully ready
+				
+					for attempt in range(max_retries):
+
+						try:
+
+							# Test if file is a valid zip
+
+							with zipfile.ZipFile(zip_path, "r") as test_zf:
+
+								test_zf.testzip()  # Verify zip integrity
+
+							break  # Success, exit retry loop
 						
-						logger.warning(
-							f"[{my_name()}][{symbol.upper()}] "
-							f"Zip file not ready "
-							f"(attempt {attempt + 1}/{max_retries}): "
-							f"{zip_path}, retrying in {current_retry_delay}s..."
-						)
+						except (zipfile.BadZipFile, FileNotFoundError) as e:
 
-						time.sleep(current_retry_delay)
-						current_retry_delay *= exp_backoff
-						# Exponential backoff
+							if attempt == max_retries - 1:
 
-				try:
-					with zipfile.ZipFile(zip_path, "r") as zf:
-						for member in zf.namelist():
-							with zf.open(member) as f:
-								for raw in f:
-									fout.write(raw.decode("utf-8"))
+								logger.error(
+									f"[{my_name()}][{symbol.upper()}] "
+									f"Zip file still invalid after "
+									f"{max_retries} attempts: "
+									f"{zip_path} → {e}"
+								)
+								return
+						
+							logger.warning(
+								f"[{my_name()}][{symbol.upper()}] "
+								f"Zip file not ready "
+								f"(attempt {attempt + 1}/{max_retries}): "
+								f"{zip_path}, retrying in {current_retry_delay}s..."
+							)
 
-				except Exception as e:
+							time.sleep(current_retry_delay)
+							current_retry_delay *= exp_backoff
+							# Exponential backoff
 
-					logger.error(
-						f"[{my_name()}][{symbol.upper()}]\n"
-						f"Failed to extract {zip_path}: {e}",
-						exc_info = True,
-					)
+					try:
+						with zipfile.ZipFile(zip_path, "r") as zf:
+							for member in zf.namelist():
+								with zf.open(member) as f:
+									shutil.copyfileobj(f, fout, COPY_CHUNK_SIZE)
 
-					return
+					except Exception as e:
+
+						logger.error(
+							f"[{my_name()}][{symbol.upper()}]\n"
+							f"Failed to extract {zip_path}: {e}",
+							exc_info = True,
+						)
+
+						return
+
+				fout.close()
+				fout = None
+
+			is_complete = True
 
 		except Exception as e:
 
 			logger.error(
 				f"[{my_name()}][{symbol.upper()}] "
-				f"Failed to open or write to merged file "
-				f"{merged_path}: {e}",
+				f"Failed to write merged archive "
+				f"{final_zip}: {e}",
 				exc_info = True,
 			)
 
@@ -339,75 +409,38 @@ def proc_symbol_consolidate_a_day(
 
 		finally:
 
-			# 🔧 Ensure the output file is properly closed
+			# 🔧 Member first (writes its header), then the central directory
+
+			for fh in (fout, archive):
 
-			if fout:
+				if fh is None: continue
 
 				try:
 
-					fout.close()
+					fh.close()
 
 				except Exception as close_error:
 
+					is_complete = False
+
 					logger.error(
 						f"[{my_name()}][{symbol.upper()}] "
-						f"Failed to close output file: "
+						f"Failed to close merged archive: "
 						f"{close_error}",
 						exc_info = True,
 					)
 
-		#———————————————————————————————————————————————————————————————————————
-		# Recompress the consolidated .jsonl
-		# into a final single-archive zip
-		#———————————————————————————————————————————————————————————————————————
+			# Never leave a half-written daily archive behind
 
-		try:
-
-			final_zip = merged_path.replace(".jsonl", ".zip")
+			if not is_complete:
 
-			with zipfile.ZipFile(
-				final_zip, "w",
-				zipfile.ZIP_DEFLATED
-			) as zf:
+				try: os.remove(final_zip)
+				except OSError: pass
 
-				zf.write(
-					merged_path,
-					arcname = os.path.basename(merged_path),
-				)
-
-		except Exception as e:
-
-			logger.error(
-				f"[{my_name()}][{symbol.upper()}] "
-				f"Failed to compress merged "
-				f"file on {day_str}: {e}",
-				exc_info = True,
-			)
-
-			# Do not remove .jsonl if compression failed
-
-			return
-
-		# Remove intermediate plain-text .jsonl file
-		# after compression
-
-		try:
-
-			if os.path.exists(merged_path):
-
-				os.remove(merged_path)
-
-		except Exception as e:
-
-			logger.error(
-				f"[{my_name()}][{symbol.upper()}] "
-				f"Failed to remove merged .jsonl "
-				f"on {day_str}: {e}",
-				exc_info = True,
-			)
+		if not is_complete: return
 
 		# Optionally delete the original temp folder
-		# containing per-minute zips
+		# containing per-minute parts
 
 		if purge:
 
@@ -426,8 +459,9 @@ def proc_symbol_consolidate_a_day(
 
 		logger.info(
 			f"[{my_name()}][{symbol.upper()}] "
-			f"Successfully merged {len(zip_files)} files "
-			f"for {day_str} (took {timer.tock():.5f} sec)."
+			f"Successfully merged {len(part_files)} files "
+			f"for {day_str} (took {timer.tock():.5f} sec"
+			f"{', isal' if has_isal else ''})."
 		)
 
 #———————————————————————————————————————————————————————————————————————————————
@@ -437,17 +471,17 @@ async def symbol_dump_snapshot(
 	#———————————————————————————————————————————————————————————————————————————
 	symbol:					str,
 	save_interval_min:		int,
-	snapshots_queue_dict:	dict[str, asyncio.Queue],
+	snapshots_queue_dict:	dict[str, ConflatingQueue],
 	lob_dir:				str,
 	managed_fhndls:			dict[str, tuple[str, TextIOWrapper]],
 	save_intv_monitor:		dict[str, deque[int]],
 	purge_on_date_change:	int,
 	merge_executor:			ProcessPoolExecutor,	# rollover (fire-and-forgat)
-	znr_executor:			ProcessPoolExecutor,	# rollover (fire-and-forgat)
 	records_max:			int,
 	logger:					logging.Logger,
 	shutdown_event:			asyncio.Event,
-	file_sync_delay_sec:	float = 0.0005,
+	persist_format:			str	  = "jsonl",		# jsonl | binary
+	batch_max:				int	  = 64,				# records per write
 	#———————————————————————————————————————————————————————————————————————————
 ):
 
@@ -502,10 +536,11 @@ async def symbol_dump_snapshot(
 
 		try:
 
-			json_writer = open(
-				file_path, "a",
-				encoding = "utf-8",
-			)
+			json_writer = open_gzip_appender(file_path)
+
+			# each opened part (and so each gzip member) is self-describing
+
+			if is_binary: json_writer.write(binary_header)
 
 		except OSError as e:
 
@@ -556,7 +591,7 @@ async def symbol_dump_snapshot(
 
 	async def fetch_snapshot(
 		#———————————————————————————————————————————————————————————————————————
-		queue:  asyncio.Queue,
+		queue:  ConflatingQueue,
 		symbol: str,
 		#———————————————————————————————————————————————————————————————————————
 	) -> Optional[dict]:
@@ -576,6 +611,8 @@ async def symbol_dump_snapshot(
 
 	#———————————————————————————————————————————————————————————————————————————
 
+	suffix_cache: list = [None, None]		# [bucket, suffix]
+
 	def get_file_suffix(
 		#———————————————————————————————————————————————————————————————————————
 		interval_min: int,
@@ -585,15 +622,30 @@ async def symbol_dump_snapshot(
 
 		try:
 
-			ts = ms_to_datetime(event_ts_ms)
+			# the suffix only changes once per bucket (minute or day)
+
+			bucket = event_ts_ms // (
+				60_000 if interval_min < 1440 else 86_400_000
+			)
+
+			if bucket == suffix_cache[0]:
+
+				return suffix_cache[1]
+
+			y, mo, d, hh, mm, _, _ = utc_fields_from_ms(event_ts_ms)
 
 			if interval_min < 1440:
 
-				return ts.strftime("%Y-%m-%d_%H-%M")
+				suffix = f"{y:04d}-{mo:02d}-{d:02d}_{hh:02d}-{mm:02d}"
 
 			else:
 
-				return ts.strftime("%Y-%m-%d")
+				suffix = f"{y:04d}-{mo:02d}-{d:02d}"
+
+			suffix_cache[0] = bucket
+			suffix_cache[1] = suffix
+
+			return suffix
 
 		except Exception as e:
 
@@ -639,6 +691,8 @@ async def symbol_dump_snapshot(
 
 	#———————————————————————————————————————————————————————————————————————————
 
+	last_temp_dir: list = [None]
+
 	async def gen_file_path(
 		#———————————————————————————————————————————————————————————————————————
 		symbol_upper: str,
@@ -650,16 +704,18 @@ async def symbol_dump_snapshot(
 		
 		try:
 
-			file_name = f"{symbol_upper}_orderbook_{suffix}.jsonl"
-			temp_dir  = os.path.join(lob_dir, "temporary",
-				f"{symbol_upper}_orderbook_{date_str}",
-			)
-			await asyncio.to_thread(
-				os.makedirs,
-				temp_dir,
-				exist_ok = True,
-			)
-			return os.path.join(temp_dir, file_name)
+			temp_dir = temp_dir_prefix + date_str
+
+			if temp_dir != last_temp_dir[0]:	# once per day
+
+				await asyncio.to_thread(
+					os.makedirs,
+					temp_dir,
+					exist_ok = True,
+				)
+				last_temp_dir[0] = temp_dir
+
+			return f"{temp_dir}{os.sep}{file_prefix}{suffix}{file_ext}.gz"
 
 		except Exception as e:
 
@@ -675,7 +731,7 @@ async def symbol_dump_snapshot(
 	def flush_snapshot(
 		#———————————————————————————————————————————————————————————————————————
 		json_writer:		TextIOWrapper,
-		snapshot:			dict,
+		batch:				list[dict],
 		symbol:				str,
 		managed_fhndls:		dict[str, tuple[str, TextIOWrapper]],
 		save_intv_monitor:	dict[str, deque[int]],
@@ -705,16 +761,21 @@ async def symbol_dump_snapshot(
 
 					return (False, latest_json_flush)
 
+			# one write per wakeup: the drained batch is encoded to
+			# bytes and joined, no str decode + re-encode per record
+
 			json_writer.write(
-				orjson.dumps(snapshot).decode() + "\n"
+				b"".join(map(pack_snapshot_binary, batch)) if is_binary
+				else b"".join([
+					json_dumps(snapshot, option = opt_append_newline)
+					for snapshot in batch
+				])
 			)
-			json_writer.flush()
+			# no per-record flush: see `flush_file_handles_periodically`
 
-			cur_time_ms = get_current_time_ms()
+			cur_time_ms = now_ms()
 
-			save_intv_monitor[symbol].append(
-				cur_time_ms - latest_json_flush
-			)
+			save_intv_append(cur_time_ms - latest_json_flush)
 			
 			latest_json_flush = cur_time_ms
 
@@ -752,8 +813,7 @@ async def symbol_dump_snapshot(
 
 	def memorize_treated(
 		#———————————————————————————————————————————————————————————————————————
-		records:	 OrderedDict[str, None],
-		records_max: int,
+		records:	 BoundedRecordSet,
 		symbol:		 str,
 		to_rec:		 str,
 		#———————————————————————————————————————————————————————————————————————
@@ -761,10 +821,8 @@ async def symbol_dump_snapshot(
 
 		try:
 
-			# discard the oldest at the front of the container
-			if len(records) >= records_max:
-				records.popitem(last = False)
-			records[to_rec] = None
+			# the oldest entry is discarded once `records_max` is reached
+			records.add(to_rec)
 
 		except Exception as e:
 
@@ -773,15 +831,53 @@ async def symbol_dump_snapshot(
 				f"for symbol='{symbol}', to_rec='{to_rec}': {e}"
 			) from e
 
+	#———————————————————————————————————————————————————————————————————————————
+	# Runs on the pool's management thread, not the event loop: only a
+	# GIL-atomic `set.discard` and a thread-safe log call happen here.
+	#———————————————————————————————————————————————————————————————————————————
+
+	def on_merge_done(
+		date: str,
+		fut:  Future,
+	):
+
+		inflight_merges.discard(date)
+
+		if not fut.cancelled() and fut.exception() is not None:
+
+			logger.error(
+				f"[{my_name()}][{symbol_upper}] "
+				f"merge for {date} failed: {fut.exception()!r}"
+			)
+
 	#———————————————————————————————————————————————————————————————————————————
 
 	queue				= snapshots_queue_dict[symbol]
 	symbol_upper		= symbol.upper()
+	is_binary			= (persist_format == "binary")
+	binary_header		= pack_binary_header(symbol)
+	file_ext			= LOB_FILE_EXT[persist_format]
+	file_prefix			= f"{symbol_upper}_orderbook_"
+	temp_dir_prefix		= os.path.join(lob_dir, "temporary", file_prefix)
 	latest_json_flush	= get_current_time_ms()
-	merged_dates_record = OrderedDict()
-	znr_minutes_record	= OrderedDict()
+	merged_dates_record = BoundedRecordSet(records_max)
+	inflight_merges		= set()		# dates submitted, not yet finished
+
+	# per-record helpers as closure cells: no global/attribute lookups
+	# inside `flush_snapshot()`
+
+	json_dumps		   = orjson.dumps
+	opt_append_newline = orjson.OPT_APPEND_NEWLINE
+	now_ms			   = get_current_time_ms
+	save_intv_append   = save_intv_monitor[symbol].append
 	
 	last_snapshot_time_ms = None		# checks timestamp order reversal
+	file_path = None
+
+	dropped_logged	= 0					# `queue.dropped` at the last warning
+	dropped_log_ms	= 0
+
+	carry = None						# next minute's first snapshot
 
 	try:
 
@@ -789,7 +885,13 @@ async def symbol_dump_snapshot(
 
 			#———————————————————————————————————————————————————————————————————
 
-			snapshot = await fetch_snapshot(queue, symbol)
+			if carry is not None:
+
+				snapshot, carry = carry, None
+
+			else:
+
+				snapshot = await fetch_snapshot(queue, symbol)
 			
 			if snapshot is None:
 				logger.critical(
@@ -797,6 +899,24 @@ async def symbol_dump_snapshot(
 					f"snapshot is None, skipping iteration."
 				)
 				continue
+
+			# the producer evicts silently; surface it here, rate-limited
+
+			if queue.dropped != dropped_logged:
+
+				cur_time_ms = now_ms()
+
+				if cur_time_ms - dropped_log_ms >= DROP_LOG_INTERVAL_MS:
+
+					logger.warning(
+						f"[{my_name()}][{symbol_upper}] "
+						f"{queue.dropped - dropped_logged} snapshots "
+						f"dropped by the full queue "
+						f"(total {queue.dropped})"
+					)
+
+					dropped_logged = queue.dropped
+					dropped_log_ms = cur_time_ms
 			
 			suffix, date_str = get_suffix_n_date(
 				save_interval_min,
@@ -811,19 +931,6 @@ async def symbol_dump_snapshot(
 				)
 				continue
 
-			file_path = await gen_file_path(
-				symbol_upper, suffix,
-				lob_dir, date_str,
-			)
-			
-			if file_path is None:
-				logger.critical(
-					f"[{my_name()}][{symbol_upper}] "
-					f"file path is None, "
-					f"skipping iteration."
-				)
-				continue
-
 			#───────────────────────────────────────────────────────────────────
 			# STEP 1: Roll-over by Minute
 			#───────────────────────────────────────────────────────────────────
@@ -843,11 +950,34 @@ async def symbol_dump_snapshot(
 
 			if last_suffix != suffix:
 
+				# directory + path only change on rollover
+
+				file_path = await gen_file_path(
+					symbol_upper, suffix,
+					lob_dir, date_str,
+				)
+
+				if file_path is None:
+					logger.critical(
+						f"[{my_name()}][{symbol_upper}] "
+						f"file path is None, "
+						f"skipping iteration."
+					)
+					continue
+
 				if json_writer:							# if not the first flush
 
 					# ──────────────────────────────────────────────────────────
+					# close() drains up to a full write buffer to disk;
+					# keep that off the event loop. Unpublish the handle
+					# first so the periodic flush cannot touch it mid-close.
+					# ──────────────────────────────────────────────────────────
+
+					managed_fhndls.pop(symbol, None)
 
-					if not safe_close_jsonl(json_writer):
+					if not await asyncio.to_thread(
+						safe_close_jsonl, json_writer,
+					):
 
 						logger.warning(
 							f"[{my_name()}][{symbol.upper()}] "
@@ -857,26 +987,6 @@ async def symbol_dump_snapshot(
 
 					del json_writer
 
-					# ──────────────────────────────────────────────────────────
-					# fire and forget
-					# ──────────────────────────────────────────────────────────
-
-					await asyncio.sleep(file_sync_delay_sec)
-
-					if last_suffix not in znr_minutes_record:
-
-						memorize_treated(
-							znr_minutes_record,
-							records_max,
-							symbol, last_suffix,
-						)
-
-						znr_executor.submit(# pickle
-							proc_zip_n_remove_jsonl,
-							lob_dir, symbol_upper, 
-							last_suffix,
-						)
-
 				# ──────────────────────────────────────────────────────────────
 
 				try: 
@@ -898,7 +1008,7 @@ async def symbol_dump_snapshot(
 
 			#───────────────────────────────────────────────────────────────────
 			# STEP 2: Check for day rollover and trigger merge
-			# At this point, ALL previous files are guaranteed to be .zip
+			# At this point, ALL previous files are closed .gz parts
 			#───────────────────────────────────────────────────────────────────
 
 			try:
@@ -908,19 +1018,23 @@ async def symbol_dump_snapshot(
 					last_date = get_date_from_suffix(last_suffix)
 
 					if ((last_date != date_str) and 
-						(last_date not in merged_dates_record)
+						(last_date not in merged_dates_record) and
+						(last_date not in inflight_merges)
 					):
 
 						memorize_treated(
 							merged_dates_record,
-							records_max,
 							symbol, last_date,
 						)
 						
+						inflight_merges.add(last_date)
+
 						merge_executor.submit(	# pickle
 							proc_symbol_consolidate_a_day,
 							symbol, last_date, lob_dir,
-							purge = (purge_on_date_change == 1),
+							purge	 = (purge_on_date_change == 1),
+						).add_done_callback(
+							functools.partial(on_merge_done, last_date)
 						)
 
 						logger.info(
@@ -948,23 +1062,42 @@ async def symbol_dump_snapshot(
 				del date_str, last_suffix
 
 			#───────────────────────────────────────────────────────────────────
-			# STEP 3: Write snapshot to file and update flush intervals
+			# STEP 3: Drain what else is queued for the same file (up to
+			# `batch_max`), write it in one go and update flush intervals.
+			# A snapshot of the next minute is carried to the next wakeup,
+			# which rolls the file over first.
 			#───────────────────────────────────────────────────────────────────
 
-			if last_snapshot_time_ms is not None:
+			batch = [snapshot]
+
+			while len(batch) < batch_max:
+
+				try: pending = queue.get_nowait()
+				except asyncio.QueueEmpty: break
+
+				if get_file_suffix(
+					save_interval_min, pending["recv_ms"],
+				) != suffix:
+
+					carry = pending
+					break
+
+				batch.append(pending)
+
+			for pending in batch:
 
 				if (
-					snapshot['recv_ms']
-					< last_snapshot_time_ms
+					last_snapshot_time_ms is not None
+					and pending['recv_ms'] < last_snapshot_time_ms
 				):
 
 					logger.critical(
 						f"[{my_name()}] "
 						f"snapshot timestamp order reversed: "
-						f"{snapshot['recv_ms']} < {last_snapshot_time_ms}"
+						f"{pending['recv_ms']} < {last_snapshot_time_ms}"
 					)
 
-			last_snapshot_time_ms = snapshot['recv_ms']
+				last_snapshot_time_ms = pending['recv_ms']
 
 			#───────────────────────────────────────────────────────────────────
 
@@ -976,7 +1109,7 @@ async def symbol_dump_snapshot(
 			) = flush_snapshot(
 				#───────────────────────────────────────────────────────────────
 				json_writer,
-				snapshot,
+				batch,
 				symbol,
 				managed_fhndls,
 				save_intv_monitor,
@@ -995,7 +1128,7 @@ async def symbol_dump_snapshot(
 
 			# await asyncio.sleep(1)		# when simulating some delays
 
-			del snapshot, file_path, is_success
+			del snapshot, batch, is_success
 
 	except asyncio.CancelledError:
 
@@ -1082,7 +1215,7 @@ async def put_snapshot(					# @depth20@100ms
 	#———————————————————————————————————————————————————————————————————————————
 	# Datafication
 	#———————————————————————————————————————————————————————————————————————————
-	snapshots_queue_dict:				dict[str, asyncio.Queue],
+	snapshots_queue_dict:				dict[str, ConflatingQueue],
 	#———————————————————————————————————————————————————————————————————————————
 	# Latency Control
 	#———————————————————————————————————————————————————————————————————————————
@@ -1129,7 +1262,7 @@ async def put_snapshot(					# @depth20@100ms
 
 	"""—————————————————————————————————————————————————————————————————————————
 	HINT:
-		asyncio.Queue(maxsize=SNAPSHOTS_QUEUE_MAX)
+		ConflatingQueue(maxsize=SNAPSHOTS_QUEUE_MAX)
 	—————————————————————————————————————————————————————————————————————————"""
 
 	async def sleep_on_ws_reconn(
@@ -1148,7 +1281,7 @@ async def put_snapshot(					# @depth20@100ms
 		try:
 
 			since_the_latest_sleep = (
-				time.time() - shared_time_dict[shared_time_dict_key]
+				time.monotonic() - shared_time_dict[shared_time_dict_key]
 			)
 
 			if (
@@ -1182,7 +1315,9 @@ async def put_snapshot(					# @depth20@100ms
 		last_recv_time_ns:		  Optional[float],
 	) -> Optional[float]:
 
-		websocket_recv_intv_stat['p90'] = None
+		websocket_recv_intv_stat['p90']		= None
+		websocket_recv_intv_stat['timeout'] = None
+		websocket_recv_intv_stat['n_new']	= 0
 		websocket_recv_interval.clear()
 		last_recv_time_ns = None
 		
@@ -1198,29 +1333,49 @@ async def put_snapshot(					# @depth20@100ms
 		minimum:		float,
 		*,
 		max_cap:		float	= 10.0,
+		refresh_div:	int		= 10,
 	) -> float:			# ws_timeout_sec (adaptive based on statistics)
-		
-		finite = [
-			x for x in data 
-			if (
-				math.isfinite(x)
-				and x >= 0.0
-			)
-		]
 
-		if len(finite) >= data.maxlen:
-			
-			p90 = float(np.percentile(finite, 90))
+		if len(data) < data.maxlen:		# O(1) until the window is full
+
+			stat['p90'] = None
+			return max(default, minimum)
+
+		# Called once per frame, but the p90 of a full window only moves
+		# once a fair share of it is new: rescan every 1/refresh_div of
+		# the window and serve the cached timeout in between.
+
+		if (
+			stat['timeout'] is not None
+			and stat['n_new'] < data.maxlen // refresh_div
+		):
+
+			stat['n_new'] += 1
+			return stat['timeout']
+
+		stat['n_new'] = 0
+
+		# one C-level pass: copy, mask, then a linear-time selection
+		# (nearest-rank p90, no interpolation needed for a timeout)
+
+		arr	   = np.fromiter(data, dtype = np.float64, count = len(data))
+		finite = arr[np.isfinite(arr) & (arr >= 0.0)]
+
+		if finite.size >= data.maxlen:
+
+			k	= int(0.9 * (finite.size - 1))
+			p90 = float(np.partition(finite, k)[k])
 			stat['p90'] = p90
 			cand = max(p90 * multiplier, minimum)
 			
-			return min(cand, max_cap)
+			stat['timeout'] = min(cand, max_cap)
 			
 		else:
 			
-			
 			stat['p90'] = None
-			return max(default, minimum)
+			stat['timeout'] = max(default, minimum)
+
+		return stat['timeout']
 
 	#———————————————————————————————————————————————————————————————————————————
 	# Howswap State
@@ -1248,7 +1403,11 @@ async def put_snapshot(					# @depth20@100ms
 	ws_timeout_sec = ws_timeout_default_sec
 	last_recv_time_ns = None
 
-	websocket_recv_intv_stat: dict[str, float | None] = {"p90": None}
+	websocket_recv_intv_stat: dict[str, float | None] = {
+		"p90":	   None,
+		"timeout": None,		# cached result of `update_ws_recv_timeout`
+		"n_new":   0,			# samples since the last rescan
+	}
 	websocket_recv_interval:  deque[float] = deque(
 		maxlen = (
 			len(symbols) *
@@ -1270,6 +1429,30 @@ async def put_snapshot(					# @depth20@100ms
 		for symbol in symbols
 	})
 
+	#———————————————————————————————————————————————————————————————————————————
+	# One dict hit per incoming frame: `<symbol>@depth20@100ms` → symbol
+	#———————————————————————————————————————————————————————————————————————————
+	# Keyed by bytes: the stream name is sliced out of the raw frame header,
+	# so routing needs no dict lookup into the parsed message.
+	#———————————————————————————————————————————————————————————————————————————
+
+	stream_to_symbol: dict[bytes, str] = {
+		f"{symbol}@depth20@100ms".encode(): symbol
+		for symbol in symbols
+	}
+
+	stream_header	  = b'{"stream":"'
+	stream_header_len = len(stream_header)
+
+	symbol_set: frozenset[str] = frozenset(symbols)
+
+	json_loads = orjson.loads	# local name: LOAD_FAST in the frame loop
+
+	# `LatencyMonitor.latency` is updated in place and never rebound,
+	# so the dict itself can be held locally: one subscript per frame.
+
+	latency_by_symbol: dict[str, Optional[int]] = lat_mon.latency
+
 	#———————————————————————————————————————————————————————————————————————————
 	# [DEBUG] We can simulate a specific time via `bias_to_add` if necessary.
 	#———————————————————————————————————————————————————————————————————————————
@@ -1283,6 +1466,10 @@ async def put_snapshot(					# @depth20@100ms
 
 	#———————————————————————————————————————————————————————————————————————————
 
+	ws_url_cache: dict[str, tuple[str, str]] = {}	# port → (url, url_to_prt)
+
+	#———————————————————————————————————————————————————————————————————————————
+
 	while not hotswap_manager.is_shutting_down():	# infinite standalone loop
 
 		cur_symbol = "UNKNOWN"
@@ -1298,10 +1485,23 @@ async def put_snapshot(					# @depth20@100ms
 					ports_stream_binance_com,
 				)
 
-			ws_url_complete = ws_url[ws_url_key].replace(
-				wildcard_stream_binance_com_port,
-				target_port,
-			)
+			# Ports cycle through a short fixed list: build each URL and
+			# its coloured log form once, then reuse them on reconnect.
+
+			cached_url = ws_url_cache.get(target_port)
+
+			if cached_url is None:
+
+				url = ws_url[ws_url_key].replace(
+					wildcard_stream_binance_com_port,
+					target_port,
+				)
+				cached_url = ws_url_cache[target_port] = (
+					url,
+					format_ws_url(url, symbols, ports_stream_binance_com),
+				)
+
+			ws_url_complete, ws_url_to_prt = cached_url
 
 			#———————————————————————————————————————————————————————————————————
 			# Within WebSocket
@@ -1312,7 +1512,8 @@ async def put_snapshot(					# @depth20@100ms
 				ssl			  = get_ssl_context(),
 				ping_interval = ws_ping_interval,
 				ping_timeout  = ws_ping_timeout,
-				compression	  = None,
+				compression	  = None,		# Binance frames are uncompressed
+				max_queue	  = 16,			# backpressure, not unbounded buffering
 			) as ws:
 
 				#———————————————————————————————————————————————————————————————
@@ -1324,15 +1525,11 @@ async def put_snapshot(					# @depth20@100ms
 					shared_time_dict_key,
 				)	# upon successful ws (re)connection
 
+				tune_ws_socket(ws)
+
 				ws_retry_cnt = 0
 				ws_start_time = time.time()
 
-				ws_url_to_prt = format_ws_url(
-					ws_url_complete,
-					symbols,
-					ports_stream_binance_com,
-				)
-
 				last_recv_time_ns = reset_ws_recv_intv_state(
 					websocket_recv_intv_stat,
 					websocket_recv_interval,
@@ -1593,7 +1790,9 @@ async def put_snapshot(					# @depth20@100ms
 						# Receive a Message or Shutting Down
 						#———————————————————————————————————————————————————————
 						
-						recv_task	  = asyncio.create_task(ws.recv())
+						recv_task	  = asyncio.create_task(
+							ws.recv(decode = False)	# bytes → orjson
+						)
 						shutdown_task = asyncio.create_task(
 							shutdown_event.wait()
 						)
@@ -1626,71 +1825,61 @@ async def put_snapshot(					# @depth20@100ms
 
 						try:
 
-							msg = orjson.loads(raw)
+							# one parse per frame, before any state is touched
+							msg = json_loads(raw)
 
 							#———————————————————————————————————————————————————
 							# Validate: <symbol>@depth20@100ms
 							#———————————————————————————————————————————————————
+							# Combined-stream frames open with
+							# `{"stream":"<name>",`; anything else reads the
+							# name from the parsed message.
+							#———————————————————————————————————————————————————
 
-							stream = msg.get("stream", "")
-							split  = stream.split("@")
+							if raw.startswith(stream_header):
 
-							if len(split) != 3:
+								stream = raw[
+									stream_header_len
+									: raw.find(b'"', stream_header_len)
+								]
 
-								raise ValueError(
-									f"unexpected "
-									f"stream: {stream}"
-								)
+							else:
 
-							if split[1] != "depth20":
+								stream = msg["stream"].encode()
 
-								raise ValueError(
-									f"expected `depth20` but"
-									f"received {split[1]}; "
-								)
+							# Binance stream names are lowercase by contract,
+							# so the full stream name is the lookup key.
 
-							if split[2] != "100ms":
+							cur_symbol = stream_to_symbol.get(stream)
 
-								raise ValueError(
-									f"expected `100ms` but"
-									f"received {split[2]}; "
-								)
-
-							cur_symbol = (
-								split[0]
-								or "UNKNOWN"
-							).lower()
+							if cur_symbol is None:
 
-							if cur_symbol not in symbols:
+								cur_symbol = "UNKNOWN"
 
 								raise ValueError(
-									f"unexpected "
-									f"symbol: {cur_symbol.upper()}"
+									f"unexpected stream: "
+									f"{stream.decode(errors = 'replace')}"
 								)
 
-							del split
-
 							#———————————————————————————————————————————————————
-							# Process the `data` Field
+							# Validate the `data` field before the interval
+							# and latency bookkeeping below
 							#———————————————————————————————————————————————————
 
-							data = msg.get("data", {})
-							bids = data.get("bids")
-							asks = data.get("asks")
-
-							if data.get("lastUpdateId") is None:
+							try:
 
-								raise ValueError(
-									f"missing `lastUpdateId` @data"
-								)
+								data = msg["data"]
+								bids = data["bids"]
+								asks = data["asks"]
+								data["lastUpdateId"]		# presence check only
 
-							if ((bids is None) or (asks is None)):
+							except KeyError as e:
 
 								raise ValueError(
-									f"missing `bids` or `asks` @data"
-								)
+									f"missing {e} @data"
+								) from None
 
-							del data
+							del msg, data
 
 							#———————————————————————————————————————————————————————
 							# SERVER TIMESTAMP RECONSTRUCTION FOR PARTIAL STREAMS
@@ -1700,7 +1889,8 @@ async def put_snapshot(					# @depth20@100ms
 							# from local receipt time with delay corrections.
 							#———————————————————————————————————————————————————————
 
-							cur_time_ms = get_current_time_ms()
+							cur_time_ns = time.time_ns()	# one clock read per frame
+							cur_time_ms = cur_time_ns // 1_000_000
 
 							if prev_snapshot_time_ms[cur_symbol] is not None:
 
@@ -1729,18 +1919,13 @@ async def put_snapshot(					# @depth20@100ms
 							# or a backup connection
 							#———————————————————————————————————————————————————
 							
-							if (
-								lat_mon.latency[cur_symbol] is None
-								or not is_active_conn
-							):
+							latency_ms = latency_by_symbol[cur_symbol]
+
+							if latency_ms is None or not is_active_conn:
 
 								continue
 
-							oneway_network_latency_ms = max(
-								0, lat_mon.latency.get(
-									cur_symbol, 0
-								)
-							)
+							oneway_network_latency_ms = max(0, latency_ms)
 
 							interval_delay_ms = max(0,
 								measured_interval_ms[cur_symbol]
@@ -1776,10 +1961,13 @@ async def put_snapshot(					# @depth20@100ms
 							# meaning that `snapshots_queue_dict` is being quickly
 							# consumed via `.get()`.
 							#———————————————————————————————————————————————————————
-							
-							await snapshots_queue_dict[
-								cur_symbol
-							].put(snapshot)
+							# If the writer stalls (disk, rollover), conflate
+							# instead of blocking the receive loop: depth20 is a
+							# full book, so `ConflatingQueue` drops the oldest
+							# and counts it (logged by `symbol_dump_snapshot`).
+							#———————————————————————————————————————————————————————
+
+							snapshots_queue_dict[cur_symbol].put_nowait(snapshot)
 
 							#———————————————————————————————————————————————————————
 							# 1st snapshot gate for FastAPI readiness
@@ -1793,8 +1981,6 @@ async def put_snapshot(					# @depth20@100ms
 							# Statistics on WebSocket Receipt Interval
 							#———————————————————————————————————————————————————————
 
-							cur_time_ns = time.time_ns()
-
 							if last_recv_time_ns is not None:
 								
 								websocket_recv_interval.append(
@@ -1817,7 +2003,7 @@ async def put_snapshot(					# @depth20@100ms
 
 							sym = (
 								cur_symbol
-								if cur_symbol in symbols
+								if cur_symbol in symbol_set
 								else "UNKNOWN"
 							)
 							logger.warning(
@@ -17,6 +17,12 @@ How to Run:
 
 	sudo chrt -f 80 nice -n -19 ionice -c1 -n0 $(which python) main.py
 
+	Optionally, for multi-day runs, swap in jemalloc to curb heap
+	fragmentation (glibc's `malloc_trim` is then skipped as a no-op):
+
+	sudo LD_PRELOAD=/usr/lib/x86_64-linux-gnu/libjemalloc.so.2 \
+		chrt -f 80 nice -n -19 ionice -c1 -n0 $(which python) main.py
+
 ————————————————————————————————————————————————————————————————————————————————
 
 Dependency:
@@ -26,6 +32,7 @@ Dependency:
 	aiohttp==3.12.14
 	certifi==2025.7.14
 	fastapi==0.116.1
+	httptools==0.6.4
 	memray==1.17.2
     numpy==2.3.2
     orjson==3.11.0
@@ -44,14 +51,15 @@ Environment Initialization:
 
 Package Validation:
 
-	conda list | egrep '^(uvloop|websockets|aiohttp|orjson|fastapi|uvicorn|psutil|pyinstaller|memray|numpy|certifi)[[:space:]]+'
+	conda list | egrep '^(uvloop|websockets|aiohttp|orjson|fastapi|httptools|uvicorn|psutil|pyinstaller|memray|numpy|certifi)[[:space:]]+'
 
 Note:
 
 	`msgspec` could have replaced `orjson`, but based on our tests, the switch
 	was deemed unnecessary. Similarly, `aiofiles` was not utilized for the same
 	reason. Finally, we prefer compatibility in compression format, sticking to
-	the standard `.zip` algorithm.
+	the standard `.zip` algorithm for the daily archives; per-minute parts are
+	written directly as `.gz` (level 1) to avoid a second compression pass.
 	
 ————————————————————————————————————————————————————————————————————————————————
 
@@ -77,7 +85,6 @@ from init import (
 )
 
 from shutdown import (
-	ShutdownManager,
 	create_shutdown_manager,
 	create_shutdown_callback,
 )
@@ -101,36 +108,38 @@ from latency import (
 )
 
 from dashboard import (
-	monitor_hardware,
+	HardwareMonitor,
 	create_dashboard_server,
 )
 
 from util import (
 	my_name,
-	resource_path,
 	get_cur_datetime_str,
 	update_shared_time_dict,
-	format_ws_url,
+	flush_file_handles_periodically,
 	set_global_logger,
 	get_ssl_context,
+	bind_listen_socket,
+	pin_to_cores,
+	init_merge_worker,
+	split_cpu_cores,
+	ConflatingQueue,
+	run_isolated,
 )
 
-import os, signal, threading, time, random, logging
-import asyncio, certifi
-from datetime import datetime, timezone
+import os, signal, threading, gc, contextlib
+import asyncio
 from collections import deque
 from io import TextIOWrapper
-from collections import OrderedDict
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 #———————————————————————————————————————————————————————————————————————————————
 
-# os.environ["SSL_CERT_FILE"] = certifi.where()
-get_ssl_context()
+get_ssl_context()		# one certifi-backed SSLContext, shared by every wss://
 
 logger, queue_listener = set_global_logger()
 
-setup_uvloop(logger = logger)
+IS_UVLOOP = setup_uvloop(logger = logger)
 
 #———————————————————————————————————————————————————————————————————————————————
 
@@ -148,6 +157,9 @@ setup_uvloop(logger = logger)
 	#
 	PURGE_ON_DATE_CHANGE,
 	SAVE_INTERVAL_MIN,
+	LOB_PERSIST_FORMAT,
+	FILE_FLUSH_INTERVAL_SEC,
+	MAIN_CPU_CORE,
 	#
 	SNAPSHOTS_QUEUE_MAX,
 	EXECUTIONS_QUEUE_MAX,
@@ -176,7 +188,7 @@ setup_uvloop(logger = logger)
 # GLOBAL ARRAYS
 #———————————————————————————————————————————————————————————————————————————————
 
-SNAPSHOTS_QUEUE_DICT:		dict[str, asyncio.Queue] = {}
+SNAPSHOTS_QUEUE_DICT:		dict[str, ConflatingQueue] = {}
 EXECUTIONS_QUEUE_DICT:		dict[str, asyncio.Queue] = {}
 
 FHNDLS_LOB_SPOT_BINANCE:	dict[str, tuple[str, TextIOWrapper]] = {}
@@ -200,14 +212,33 @@ if __name__ == "__main__":
 	from uvicorn.server import Server
 
 	#———————————————————————————————————————————————————————————————————————————
-	# THESE TWO MUST BE WITHIN THE MAIN PROCESS
+	# THIS MUST BE WITHIN THE MAIN PROCESS
+	#———————————————————————————————————————————————————————————————————————————
+	# Daily merges fire once per symbol per UTC day for both streams; one
+	# pool capped at the core count serves them all, so idle interpreters
+	# no longer scale with 2 × len(SYMBOLS).
+	# With MAIN_CPU_CORE set, the event loop keeps that core to itself and
+	# the merge workers are confined to the rest, so deflate bursts do not
+	# evict the websocket read path from L1/L2.
 	#———————————————————————————————————————————————————————————————————————————
 
-	LOB_MERGE_EXC_SPOT_BINANCE = ProcessPoolExecutor(max_workers = len(SYMBOLS))
-	EXE_MERGE_EXC_SPOT_BINANCE = ProcessPoolExecutor(max_workers = len(SYMBOLS))
+	MAIN_CORES, WORKER_CORES = split_cpu_cores(MAIN_CPU_CORE)
 
-	LOB_ZNR_EXC_SPOT_BINANCE   = ProcessPoolExecutor(max_workers = len(SYMBOLS))
-	EXE_ZNR_EXC_SPOT_BINANCE   = ProcessPoolExecutor(max_workers = len(SYMBOLS))
+	MERGE_EXC_SPOT_BINANCE = ProcessPoolExecutor(
+		max_workers = min(
+			len(SYMBOLS),
+			len(WORKER_CORES) or os.cpu_count() or 1,
+		),
+		initializer = init_merge_worker,		# off real-time, then pin
+		initargs	= (WORKER_CORES,),
+	)
+
+	if pin_to_cores(MAIN_CORES):
+
+		logger.info(
+			f"[{my_name()}] main pinned to {sorted(MAIN_CORES)}, "
+			f"merge workers to {sorted(WORKER_CORES)}"
+		)
 
 	#———————————————————————————————————————————————————————————————————————————
 	# SHUTDOWN MANAGER SETUP
@@ -220,11 +251,7 @@ if __name__ == "__main__":
 
 	SHUTDOWN_MANAGER.register_executors(
 		#———————————————————————————————————————————————————————————————————————
-		lob_merge_exc_spot_binance = LOB_MERGE_EXC_SPOT_BINANCE,
-		exe_merge_exc_spot_binance = EXE_MERGE_EXC_SPOT_BINANCE,
-		#———————————————————————————————————————————————————————————————————————
-		lob_znr_exc_spot_binance   = LOB_ZNR_EXC_SPOT_BINANCE,
-		exe_znr_exc_spot_binance   = EXE_ZNR_EXC_SPOT_BINANCE,
+		merge_exc_spot_binance = MERGE_EXC_SPOT_BINANCE,
 		#———————————————————————————————————————————————————————————————————————
 	)
 	SHUTDOWN_MANAGER.register_symbols(SYMBOLS)
@@ -236,6 +263,18 @@ if __name__ == "__main__":
 
 		try:
 
+			#———————————————————————————————————————————————————————————————————
+			# `asyncio.to_thread` (flushes, closes, psutil samples) runs on
+			# the default executor; keep it small and named.
+			#———————————————————————————————————————————————————————————————————
+
+			asyncio.get_running_loop().set_default_executor(
+				ThreadPoolExecutor(
+					max_workers		   = 4,
+					thread_name_prefix = "to_thread",
+				)
+			)
+
 			#———————————————————————————————————————————————————————————————————
 
 			init_runtime_state(
@@ -302,248 +341,319 @@ if __name__ == "__main__":
 				shutdown_manager = SHUTDOWN_MANAGER,
 				logger =		   logger,
 			)
+
+			#———————————————————————————————————————————————————————————————————
+			# Long-lived state (config, queues, FastAPI app, ...) is built by
+			# now: move it to the permanent generation so young collections
+			# stop re-traversing it, and let gen-0 fill up further before a
+			# collection interrupts the per-message JSON churn.
+			#———————————————————————————————————————————————————————————————————
+
+			gc.collect()
+			gc.freeze()
+			gc.set_threshold(50_000, 10, 10)
 			
 			#———————————————————————————————————————————————————————————————————
-			# Launch Asynchronous Coroutines
+			# Every long-lived coroutine is a child of one TaskGroup: strong
+			# references for free, and when the server exits the rest are
+			# cancelled and joined instead of being abandoned. Children run
+			# under `run_isolated`, so one failing task is logged and ends
+			# alone, as before. `cleanup` unwinds after the group has joined.
 			#———————————————————————————————————————————————————————————————————
 
-			try:
+			async with (
+				contextlib.AsyncExitStack() as cleanup,
+				asyncio.TaskGroup() as tg,
+			):
 
-				#———————————————————————————————————————————————————————————————
-				# Websocket (re)connection attempt requires at minimum 1.0s
-				# after each trial (https://tinyurl.com/BinanceWsMan);
-				# exponential backoff unnecessary
-				#———————————————————————————————————————————————————————————————
+				children: list[asyncio.Task] = []
 
-				update_shared_time_dict(SHARED_TIME_DICT,
-					'LATEST_SLEEP_TIME_BINANCE_STREAM',
-				)
+				def spawn(coro, name: str) -> asyncio.Task:
+
+					task = tg.create_task(
+						run_isolated(coro, name, logger), name = name,
+					)
+					children.append(task)
+
+					return task
 
 				#———————————————————————————————————————————————————————————————
-				# put_snapshot @core.py
+				# Launch Asynchronous Coroutines
 				#———————————————————————————————————————————————————————————————
-				
-				HSM_PUT_SNAPSHOT_BINANCE_DEPTH20_100MS = HotSwapManager(
-					name = "put_snapshot_binance_depth20_100ms",
-					shutdown_event = MAIN_SHUTDOWN_EVENT,
-				)
 
-				put_snapshot_task = asyncio.create_task(
-					put_snapshot(								# @depth20@100ms
-						#———————————————————————————————————————————————————————
-						PUT_SNAPSHOT_INTERVAL,
-						#———————————————————————————————————————————————————————
-						SNAPSHOTS_QUEUE_DICT,
-						#———————————————————————————————————————————————————————
-						LAT_MON_SPOT_BINANCE,
-						#———————————————————————————————————————————————————————
-						SHARED_TIME_DICT,
+				try:
+
+					#———————————————————————————————————————————————————————————
+					# Websocket (re)connection attempt requires at minimum 1.0s
+					# after each trial (https://tinyurl.com/BinanceWsMan);
+					# exponential backoff unnecessary
+					#———————————————————————————————————————————————————————————
+
+					update_shared_time_dict(SHARED_TIME_DICT,
 						'LATEST_SLEEP_TIME_BINANCE_STREAM',
-						1.5,		# `sleep_on_ws_reconn`
-						#———————————————————————————————————————————————————————
-						WS_URL, 'STREAM_BINANCE_COM_DEPTH20_100MS',
-						WILDCARD_STREAM_BINANCE_COM_PORT,
-						PORTS_STREAM_BINANCE_COM,
-						#———————————————————————————————————————————————————————
-						WS_PING_INTERVAL, WS_PING_TIMEOUT,
-						SYMBOLS, logger,
-						#———————————————————————————————————————————————————————
-						port_cycling_period_hrs = PORT_CYCLING_PERIOD_HRS,
-						back_up_ready_ahead_sec = BACK_UP_READY_AHEAD_SEC,
-						hotswap_manager = HSM_PUT_SNAPSHOT_BINANCE_DEPTH20_100MS,
-						shutdown_event	= MAIN_SHUTDOWN_EVENT,
-						handoff_event	= None,
-						is_backup		= False,
-						#———————————————————————————————————————————————————————
-					),
-					name = f"put_snapshot() @{get_cur_datetime_str()}",
-				)
+					)
 
-				HSM_PUT_SNAPSHOT_BINANCE_DEPTH20_100MS.\
-					append_task_w_creation_time(
-						put_snapshot_task,
+					#———————————————————————————————————————————————————————————
+					# put_snapshot @core.py
+					#———————————————————————————————————————————————————————————
+				
+					HSM_PUT_SNAPSHOT_BINANCE_DEPTH20_100MS = HotSwapManager(
+						name = "put_snapshot_binance_depth20_100ms",
+						shutdown_event = MAIN_SHUTDOWN_EVENT,
 					)
 
-				#———————————————————————————————————————————————————————————————
-				# put_execution @exec.py
-				#———————————————————————————————————————————————————————————————
+					put_snapshot_task = spawn(
+						put_snapshot(								# @depth20@100ms
+							#———————————————————————————————————————————————————
+							PUT_SNAPSHOT_INTERVAL,
+							#———————————————————————————————————————————————————
+							SNAPSHOTS_QUEUE_DICT,
+							#———————————————————————————————————————————————————
+							LAT_MON_SPOT_BINANCE,
+							#———————————————————————————————————————————————————
+							SHARED_TIME_DICT,
+							'LATEST_SLEEP_TIME_BINANCE_STREAM',
+							1.5,		# `sleep_on_ws_reconn`
+							#———————————————————————————————————————————————————
+							WS_URL, 'STREAM_BINANCE_COM_DEPTH20_100MS',
+							WILDCARD_STREAM_BINANCE_COM_PORT,
+							PORTS_STREAM_BINANCE_COM,
+							#———————————————————————————————————————————————————
+							WS_PING_INTERVAL, WS_PING_TIMEOUT,
+							SYMBOLS, logger,
+							#———————————————————————————————————————————————————
+							port_cycling_period_hrs = PORT_CYCLING_PERIOD_HRS,
+							back_up_ready_ahead_sec = BACK_UP_READY_AHEAD_SEC,
+							hotswap_manager = HSM_PUT_SNAPSHOT_BINANCE_DEPTH20_100MS,
+							shutdown_event	= MAIN_SHUTDOWN_EVENT,
+							handoff_event	= None,
+							is_backup		= False,
+							#———————————————————————————————————————————————————
+						),
+						name = f"put_snapshot() @{get_cur_datetime_str()}",
+					)
 
-				HSM_PUT_EXECUTION_BINANCE_AGGTRADE = HotSwapManager(
-					name = "put_execution_binance_aggtrade",
-					shutdown_event = MAIN_SHUTDOWN_EVENT,
-				)
+					HSM_PUT_SNAPSHOT_BINANCE_DEPTH20_100MS.\
+						append_task_w_creation_time(
+							put_snapshot_task,
+						)
 
-				put_execution_task = asyncio.create_task(
-					put_execution(									# @aggTrade
-						#———————————————————————————————————————————————————————
-						EXECUTIONS_QUEUE_DICT,
-						#———————————————————————————————————————————————————————
-						LAT_MON_SPOT_BINANCE,
-						#———————————————————————————————————————————————————————
-						SHARED_TIME_DICT,
-						'LATEST_SLEEP_TIME_BINANCE_STREAM',
-						1.5,		# `sleep_on_ws_reconn`
-						#———————————————————————————————————————————————————————
-						WS_URL, 'STREAM_BINANCE_COM_AGGTRADE',
-						WILDCARD_STREAM_BINANCE_COM_PORT,
-						PORTS_STREAM_BINANCE_COM,
-						#———————————————————————————————————————————————————————
-						WS_PING_INTERVAL, WS_PING_TIMEOUT, WEBSOCKET_PEER,
-						SYMBOLS, logger,
-						#———————————————————————————————————————————————————————
-						port_cycling_period_hrs = PORT_CYCLING_PERIOD_HRS,
-						back_up_ready_ahead_sec = BACK_UP_READY_AHEAD_SEC,
-						hotswap_manager = HSM_PUT_EXECUTION_BINANCE_AGGTRADE,
-						shutdown_event	= MAIN_SHUTDOWN_EVENT,
-						handoff_event	= None,
-						is_backup		= False,
-						#———————————————————————————————————————————————————————
-					),
-					name = f"put_execution() @{get_cur_datetime_str()}",
-				)
+					#———————————————————————————————————————————————————————————
+					# put_execution @exec.py
+					#———————————————————————————————————————————————————————————
 
-				HSM_PUT_EXECUTION_BINANCE_AGGTRADE.\
-					append_task_w_creation_time(
-						put_execution_task,
+					HSM_PUT_EXECUTION_BINANCE_AGGTRADE = HotSwapManager(
+						name = "put_execution_binance_aggtrade",
+						shutdown_event = MAIN_SHUTDOWN_EVENT,
+					)
+
+					put_execution_task = spawn(
+						put_execution(									# @aggTrade
+							#———————————————————————————————————————————————————
+							EXECUTIONS_QUEUE_DICT,
+							#———————————————————————————————————————————————————
+							LAT_MON_SPOT_BINANCE,
+							#———————————————————————————————————————————————————
+							SHARED_TIME_DICT,
+							'LATEST_SLEEP_TIME_BINANCE_STREAM',
+							1.5,		# `sleep_on_ws_reconn`
+							#———————————————————————————————————————————————————
+							WS_URL, 'STREAM_BINANCE_COM_AGGTRADE',
+							WILDCARD_STREAM_BINANCE_COM_PORT,
+							PORTS_STREAM_BINANCE_COM,
+							#———————————————————————————————————————————————————
+							WS_PING_INTERVAL, WS_PING_TIMEOUT, WEBSOCKET_PEER,
+							SYMBOLS, logger,
+							#———————————————————————————————————————————————————
+							port_cycling_period_hrs = PORT_CYCLING_PERIOD_HRS,
+							back_up_ready_ahead_sec = BACK_UP_READY_AHEAD_SEC,
+							hotswap_manager = HSM_PUT_EXECUTION_BINANCE_AGGTRADE,
+							shutdown_event	= MAIN_SHUTDOWN_EVENT,
+							handoff_event	= None,
+							is_backup		= False,
+							#———————————————————————————————————————————————————
+						),
+						name = f"put_execution() @{get_cur_datetime_str()}",
 					)
+
+					HSM_PUT_EXECUTION_BINANCE_AGGTRADE.\
+						append_task_w_creation_time(
+							put_execution_task,
+						)
 				
-				#———————————————————————————————————————————————————————————————
+					#———————————————————————————————————————————————————————————
 
-				monitor_hardware_task = asyncio.create_task(
-					monitor_hardware(
+					hardware_monitor = HardwareMonitor(		# call_later timer
 						dashboard_server,
 						HARDWARE_MONITORING_INTERVAL,
 						CPU_PERCENT_DURATION,
 						DESIRED_MAX_SYS_MEM_LOAD,
 						logger,
-					),
-					name = "monitor_hardware()",
-				)
-
-				#———————————————————————————————————————————————————————————————
-				# symbol_dump_snapshot @core.py
-				#———————————————————————————————————————————————————————————————
-
-				for symbol in SYMBOLS:
-					task = asyncio.create_task(
-						symbol_dump_snapshot(
-							symbol,
-							SAVE_INTERVAL_MIN,
-							SNAPSHOTS_QUEUE_DICT,
-							LOB_DIR,
-							FHNDLS_LOB_SPOT_BINANCE,
-							LOB_SAV_INTV_SPOT_BINANCE,		# monitoring
-							PURGE_ON_DATE_CHANGE,
-							LOB_MERGE_EXC_SPOT_BINANCE,		# fire-and-forget
-							LOB_ZNR_EXC_SPOT_BINANCE,		# fire-and-forget
-							RECORDS_MAX,
+					)
+					hardware_monitor.start()
+					cleanup.callback(hardware_monitor.stop)
+
+					#———————————————————————————————————————————————————————————
+					# symbol_dump_snapshot @core.py
+					#———————————————————————————————————————————————————————————
+
+					for symbol in SYMBOLS:
+						spawn(
+							symbol_dump_snapshot(
+								symbol,
+								SAVE_INTERVAL_MIN,
+								SNAPSHOTS_QUEUE_DICT,
+								LOB_DIR,
+								FHNDLS_LOB_SPOT_BINANCE,
+								LOB_SAV_INTV_SPOT_BINANCE,		# monitoring
+								PURGE_ON_DATE_CHANGE,
+								MERGE_EXC_SPOT_BINANCE,			# fire-and-forget
+								RECORDS_MAX,
+								logger,
+								MAIN_SHUTDOWN_EVENT,
+								persist_format = LOB_PERSIST_FORMAT,
+							),
+							name = f"symbol_dump_snapshot({symbol})",
+						)
+
+					#———————————————————————————————————————————————————————————
+					# symbol_dump_execution @core.py
+					#———————————————————————————————————————————————————————————
+
+					for symbol in SYMBOLS:
+						spawn(
+							symbol_dump_execution(
+								symbol,
+								SAVE_INTERVAL_MIN,
+								EXECUTIONS_QUEUE_DICT,
+								CHART_DIR,
+								FHNDLS_EXE_SPOT_BINANCE,
+								EXE_SAV_INTV_SPOT_BINANCE,		# monitoring
+								PURGE_ON_DATE_CHANGE,
+								MERGE_EXC_SPOT_BINANCE,			# fire-and-forget
+								RECORDS_MAX,
+								logger,
+								MAIN_SHUTDOWN_EVENT,
+							),
+							name = f"symbol_dump_execution({symbol})",
+						)
+
+					#———————————————————————————————————————————————————————————
+					# writers no longer flush per record; bound the loss window
+					#———————————————————————————————————————————————————————————
+
+					spawn(
+						flush_file_handles_periodically(
+							[
+								FHNDLS_LOB_SPOT_BINANCE,
+								FHNDLS_EXE_SPOT_BINANCE,
+							],
+							FILE_FLUSH_INTERVAL_SEC,
 							logger,
 							MAIN_SHUTDOWN_EVENT,
 						),
-						name = f"symbol_dump_snapshot({symbol})",
+						name = "flush_file_handles_periodically()",
 					)
 
-				#———————————————————————————————————————————————————————————————
-				# symbol_dump_execution @core.py
-				#———————————————————————————————————————————————————————————————
+					#———————————————————————————————————————————————————————————
 
-				for symbol in SYMBOLS:
-					task = asyncio.create_task(
-						symbol_dump_execution(
-							symbol,
-							SAVE_INTERVAL_MIN,
-							EXECUTIONS_QUEUE_DICT,
-							CHART_DIR,
-							FHNDLS_EXE_SPOT_BINANCE,
-							EXE_SAV_INTV_SPOT_BINANCE,		# monitoring
-							PURGE_ON_DATE_CHANGE,
-							EXE_MERGE_EXC_SPOT_BINANCE,		# fire-and-forget
-							EXE_ZNR_EXC_SPOT_BINANCE,		# fire-and-forget
-							RECORDS_MAX,
+					spawn(
+						gate_streaming_by_latency(
+							LAT_MON_SPOT_BINANCE,
+							SYMBOLS,
 							logger,
 							MAIN_SHUTDOWN_EVENT,
 						),
-						name = f"symbol_dump_execution({symbol})",
+						name = "gate_streaming_by_latency()",
 					)
 
-				#———————————————————————————————————————————————————————————————
+					#———————————————————————————————————————————————————————————
+					# Cleanup Callback for HotSwapManaters
+					#———————————————————————————————————————————————————————————
 
-				gate_streaming_by_latency_task = asyncio.create_task(
-					gate_streaming_by_latency(
-						LAT_MON_SPOT_BINANCE,
-						SYMBOLS,
-						logger,
-						MAIN_SHUTDOWN_EVENT,
-					),
-					name = "gate_streaming_by_latency()",
-				)
+					SHUTDOWN_MANAGER.add_cleanup_callback(
+						create_shutdown_callback(
+							hotswap_manager  = HSM_PUT_SNAPSHOT_BINANCE_DEPTH20_100MS,
+							shutdown_manager = SHUTDOWN_MANAGER,
+							logger			 = logger,
+						)
+					)
+
+					#———————————————————————————————————————————————————————————
+
+				except Exception as e:
+
+					logger.critical(
+						f"[{my_name()}] failed to launch "
+						f"async coroutines: {e}",
+						exc_info=True
+					)
+					raise SystemExit from e
 
 				#———————————————————————————————————————————————————————————————
-				# Cleanup Callback for HotSwapManaters
+				# Wait for at least one valid snapshot before serving
 				#———————————————————————————————————————————————————————————————
 
-				SHUTDOWN_MANAGER.add_cleanup_callback(
-					create_shutdown_callback(
-						hotswap_manager  = HSM_PUT_SNAPSHOT_BINANCE_DEPTH20_100MS,
-						shutdown_manager = SHUTDOWN_MANAGER,
-						logger			 = logger,
-					)
-				)
+				await LAT_MON_SPOT_BINANCE.evnt_1st_dom.wait()
+				await LAT_MON_SPOT_BINANCE.evnt_1st_exe.wait()
 
+				#———————————————————————————————————————————————————————————————
+				# FastAPI
 				#———————————————————————————————————————————————————————————————
 
-			except Exception as e:
+				try:
 
-				logger.critical(
-					f"[{my_name()}] failed to launch "
-					f"async coroutines: {e}",
-					exc_info=True
-				)
-				raise SystemExit from e
+					# `loop` only describes the setup: `serve()` runs on the
+					# loop that is already running
+
+					cfg = Config(
+						app		  			   = dashboard_server.app,
+						host	  			   = "0.0.0.0",
+						port	  			   = DASHBOARD_PORT_NUMBER,
+						lifespan  			   = "on",
+						use_colors			   = False,
+						log_level 			   = "warning",
+						workers	  			   = 1,
+						loop	  			   = "uvloop" if IS_UVLOOP else "asyncio",
+						http	  			   = "auto",		# httptools if installed, else h11
+						ws		  			   = "websockets",
+						interface			   = "asgi3",		# FastAPI; skip probing
+						access_log			   = False,
+						ws_per_message_deflate = False,
+						server_header		   = False,
+						date_header			   = False,
+					)
 
-			#———————————————————————————————————————————————————————————————————
-			# Wait for at least one valid snapshot before serving
-			#———————————————————————————————————————————————————————————————————
+					# uvicorn keeps its own SIGINT/SIGTERM capture: it drains
+					# the server first, then re-raises to SHUTDOWN_MANAGER.
 
-			await LAT_MON_SPOT_BINANCE.evnt_1st_dom.wait()
-			await LAT_MON_SPOT_BINANCE.evnt_1st_exe.wait()
+					dashboard_sock = bind_listen_socket(
+						"0.0.0.0", DASHBOARD_PORT_NUMBER,
+					)
 
-			#———————————————————————————————————————————————————————————————————
-			# FastAPI
-			#———————————————————————————————————————————————————————————————————
+					server = Server(cfg)
+					logger.info(
+						f"[{my_name()}]🚀 fastapi starts → "
+						f"http://localhost:{DASHBOARD_PORT_NUMBER}/dashboard"
+					)
+					await server.serve(sockets = [dashboard_sock])
+					logger.info(
+						f"[{my_name()}]⚓ fastapi ends"
+					)
 
-			try:
-
-				cfg = Config(
-					app		  			   = dashboard_server.app,
-					host	  			   = "0.0.0.0",
-					port	  			   = DASHBOARD_PORT_NUMBER,
-					lifespan  			   = "on",
-					use_colors			   = True,
-					log_level 			   = "warning",
-					workers	  			   = 1,
-					loop	  			   = "asyncio",
-					ws_per_message_deflate = False,
-				)
+					# the children loop until cancelled; leaving the
+					# TaskGroup then joins them
 
-				server = Server(cfg)
-				logger.info(
-					f"[{my_name()}]🚀 fastapi starts → "
-					f"http://localhost:{DASHBOARD_PORT_NUMBER}/dashboard"
-				)
-				await server.serve()
-				logger.info(
-					f"[{my_name()}]⚓ fastapi ends"
-				)
+					for task in children: task.cancel()
 
-			except Exception as e:
+				except Exception as e:
 
-				logger.critical(
-					f"[{my_name()}] fastapi "
-					f"failed to start: {e}",
-					exc_info=True
-				)
-				raise SystemExit from e
+					logger.critical(
+						f"[{my_name()}] fastapi "
+						f"failed to start: {e}",
+						exc_info=True
+					)
+					raise SystemExit from e
 
 		#———————————————————————————————————————————————————————————————————————
 
@@ -558,7 +668,16 @@ if __name__ == "__main__":
 
 #———————————————————————————————————————————————————————————————————————————————
 
-	try: asyncio.run(main())
+	if IS_UVLOOP:
+
+		import uvloop
+		run_main = uvloop.run		# builds the uvloop.Loop directly
+
+	else:
+
+		run_main = asyncio.run
+
+	try: run_main(main())
 
 	except KeyboardInterrupt:
 
@@ -580,11 +699,17 @@ if __name__ == "__main__":
 		try: queue_listener.stop()
 		except Exception: pass
 
-		def conditional_force_exit(
-			patience_sec: float = 10.0
-		):
+		#———————————————————————————————————————————————————————————————————————
+		# Watchdog for a hung `graceful_shutdown()`: the loop is gone by
+		# now, so instead of a sleeper thread the kernel's SIGALRM timer
+		# fires the check (POSIX); other platforms keep the thread.
+		#———————————————————————————————————————————————————————————————————————
 
-			time.sleep(patience_sec)
+		FORCE_EXIT_PATIENCE_SEC = 10
+
+		shutdown_done = threading.Event()		# disarms the watchdog
+
+		def conditional_force_exit(*_):
 
 			if (
 				SHUTDOWN_MANAGER
@@ -609,10 +734,22 @@ if __name__ == "__main__":
 
 					os._exit(1)
 
-		threading.Thread(
-			target=conditional_force_exit,
-			daemon=True
-		).start()
+		if hasattr(signal, "SIGALRM"):
+
+			signal.signal(signal.SIGALRM, conditional_force_exit)
+			signal.alarm(FORCE_EXIT_PATIENCE_SEC)
+
+		else:
+
+			def wait_then_force_exit():
+
+				if not shutdown_done.wait(FORCE_EXIT_PATIENCE_SEC):
+					conditional_force_exit()
+
+			threading.Thread(
+				target=wait_then_force_exit,
+				daemon=True
+			).start()
 
 		if (
 			SHUTDOWN_MANAGER
@@ -620,5 +757,17 @@ if __name__ == "__main__":
 		):
 			
 			SHUTDOWN_MANAGER.graceful_shutdown()
+
+		# clean exit: stand the watchdog down instead of letting it fire
+
+		if (
+			not SHUTDOWN_MANAGER
+			or SHUTDOWN_MANAGER.is_shutdown_complete()
+		):
+
+			shutdown_done.set()
+
+			if hasattr(signal, "SIGALRM"):
+				signal.alarm(0)
 			
 #———————————————————————————————————————————————————————————————————————————————
\ No newline at end of file
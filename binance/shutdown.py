@@ -1,10 +1,9 @@
 # shutdown.py @2025-08-07 18:09 / DO NOT BLINDLY MODIFY THIS CODE
 
-import sys, os, asyncio, threading, signal, time, logging, copy
-import concurrent.futures
+import sys, os, asyncio, threading, signal, time, logging
 from concurrent.futures import ProcessPoolExecutor
 from io import TextIOWrapper
-from typing import Optional, Callable
+from typing import Callable
 from util import my_name
 from hotswap import HotSwapManager
 
@@ -0,0 +1,50 @@
+import logging
+import pytest
+from fastapi.testclient import TestClient
+
+import dashboard
+from dashboard import create_dashboard_server
+
+HTML = b"<!DOCTYPE html><html><body>dashboard</body></html>"
+
+@pytest.fixture
+def make_client(monkeypatch):
+	def _make(html_path):
+		monkeypatch.setattr(
+			dashboard, "resource_path", lambda *_args, **_kwargs: str(html_path)
+		)
+		server = create_dashboard_server(
+			state_refs = {"SYMBOLS": ["btcusdt"]},
+			config = {},
+			shutdown_manager = None,
+			logger = logging.getLogger("test_dashboard"),
+		)
+		return TestClient(server.app)	# no lifespan: first GET loads the HTML
+	return _make
+
+def test_dashboard_page_etag_and_304(tmp_path, make_client):
+	html_path = tmp_path / "dashboard.html"
+	html_path.write_bytes(HTML)
+	client = make_client(html_path)
+
+	response = client.get("/dashboard")
+	assert response.status_code == 200
+	assert response.content == HTML
+	etag = response.headers["etag"]
+	assert etag
+
+	response = client.get("/dashboard", headers={"If-None-Match": etag})
+	assert response.status_code == 304
+	assert response.headers["etag"] == etag
+	assert response.content == b""
+
+	response = client.get("/dashboard", headers={"If-None-Match": '"stale"'})
+	assert response.status_code == 200
+	assert response.content == HTML
+
+def test_dashboard_page_missing_file(tmp_path, make_client):
+	client = make_client(tmp_path / "missing.html")
+
+	response = client.get("/dashboard")
+	assert response.status_code == 500
+	assert response.json() == {"detail": "Dashboard HTML file missing"}
@@ -0,0 +1,57 @@
+import math
+import pytest
+from lob import (
+	LOB_BINARY_LEVELS,
+	load_lob_binary,
+	pack_binary_header,
+	pack_snapshot_binary,
+)
+
+SNAPSHOT = {
+	"recv_ms":		1_750_000_000_123,
+	"net_delay_ms":	7,
+	"intv_lag_ms":	-2,
+	"bids":			[[100.5, 1.25], [100.4, 3.0]],
+	"asks":			[[100.6, 0.5]],
+}
+
+def test_pack_snapshot_binary_round_trip():
+	raw = pack_binary_header("btcusdt") + pack_snapshot_binary(SNAPSHOT)
+
+	symbol, records = load_lob_binary(raw)
+
+	assert symbol == "BTCUSDT"
+	assert records.shape == (1,)
+
+	rec = records[0]
+	assert rec["recv_ms"] == SNAPSHOT["recv_ms"]
+	assert rec["net_delay_ms"] == SNAPSHOT["net_delay_ms"]
+	assert rec["intv_lag_ms"] == SNAPSHOT["intv_lag_ms"]
+	assert rec["bid_px"].shape == (LOB_BINARY_LEVELS,)
+	assert list(rec["bid_px"][:2]) == [100.5, 100.4]
+	assert list(rec["bid_qty"][:2]) == [1.25, 3.0]
+	assert rec["ask_px"][0] == 100.6 and rec["ask_qty"][0] == 0.5
+	assert math.isnan(rec["bid_px"][2]) and math.isnan(rec["ask_qty"][1])
+
+def test_load_lob_binary_strips_per_part_headers(tmp_path):
+	part = pack_binary_header("btcusdt") + pack_snapshot_binary(SNAPSHOT)
+	path = tmp_path / "BTCUSDT_orderbook_2025-06-15.bin"
+	path.write_bytes(part * 3)		# three parts, merged back to back
+
+	symbol, records = load_lob_binary(str(path))
+
+	assert symbol == "BTCUSDT"
+	assert len(records) == 3
+	assert (records["recv_ms"] == SNAPSHOT["recv_ms"]).all()
+
+def test_load_lob_binary_rejects_headerless_stream():
+	with pytest.raises(ValueError):
+		load_lob_binary(pack_snapshot_binary(SNAPSHOT))
+
+def test_load_lob_binary_rejects_mixed_symbols():
+	raw = (
+		pack_binary_header("btcusdt") + pack_snapshot_binary(SNAPSHOT)
+		+ pack_binary_header("ethusdt") + pack_snapshot_binary(SNAPSHOT)
+	)
+	with pytest.raises(ValueError):
+		load_lob_binary(raw)
@@ -2,14 +2,14 @@
 
 #———————————————————————————————————————————————————————————————————————————————
 
-import sys, os, time, inspect, logging, multiprocessing
+import sys, os, io, gzip, time, logging, multiprocessing, threading
 import asyncio, uvloop
 import aiohttp, socket
 import ssl, certifi
 from datetime import datetime, timezone
 from logging.handlers import QueueHandler, QueueListener
-from typing import Callable, Optional
-from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
+from collections import OrderedDict, deque
 
 #———————————————————————————————————————————————————————————————————————————
 # https://tinyurl.com/ANSI-256-Color-Palette
@@ -116,6 +116,67 @@ def get_ssl_context():
 
 	return _SSL_CTX
 
+#———————————————————————————————————————————————————————————————————————————————
+# CPU affinity & scheduling (Linux only; a no-op elsewhere). The merge
+# pool's initializer must stay module-level so that it can be pickled.
+#———————————————————————————————————————————————————————————————————————————————
+
+def pin_to_cores(cores: frozenset[int]) -> bool:
+
+	if not cores or not hasattr(os, "sched_setaffinity"):
+		return False
+
+	try:
+
+		os.sched_setaffinity(0, cores)
+		return True
+
+	except OSError:
+
+		return False
+
+def init_merge_worker(cores: frozenset[int]) -> None:
+
+	"""
+	Merge workers are forked from a process launched under `chrt -f 80`
+	and would inherit SCHED_FIFO, contending with the websocket loop at
+	real-time priority. Drop them to SCHED_OTHER, lowest nice, then pin.
+	"""
+
+	if hasattr(os, "sched_setscheduler"):
+
+		try:
+
+			if os.sched_getscheduler(0) in (os.SCHED_FIFO, os.SCHED_RR):
+
+				os.sched_setscheduler(0, os.SCHED_OTHER, os.sched_param(0))
+
+			os.setpriority(os.PRIO_PROCESS, 0, 19)
+
+		except OSError: pass
+
+	pin_to_cores(cores)
+
+def split_cpu_cores(
+	main_core: int,
+) -> tuple[frozenset[int], frozenset[int]]:
+
+	"""
+	Returns (main, workers) core sets. `main_core < 0`, a core not in
+	this process' allowed set, or a single-core box disables the split
+	and returns two empty sets.
+	"""
+
+	if main_core < 0 or not hasattr(os, "sched_getaffinity"):
+		return frozenset(), frozenset()
+
+	allowed = frozenset(os.sched_getaffinity(0))
+
+	if main_core not in allowed or len(allowed) < 2:
+		return frozenset(), frozenset()
+
+	return frozenset({main_core}), allowed - {main_core}
+
 #———————————————————————————————————————————————————————————————————————————————
 
 async def is_uvloop_alive() -> bool:
@@ -133,6 +194,43 @@ async def is_uvloop_alive() -> bool:
 		
 		return False
 
+#———————————————————————————————————————————————————————————————————————————————
+
+class BoundedRecordSet:
+
+	"""
+	Insertion-ordered set that forgets its oldest entry beyond `maxlen`:
+	a `deque(maxlen)` for the order and a `set` for O(1) membership.
+	"""
+
+	__slots__ = ("_order", "_seen")
+
+	def __init__(self, maxlen: int):
+
+		self._order: deque[str] = deque(maxlen = maxlen)
+		self._seen:  set[str]	= set()
+
+	def __contains__(self, key: str) -> bool:
+
+		return key in self._seen
+
+	def __len__(self) -> int:
+
+		return len(self._order)
+
+	def add(self, key: str):
+
+		if key in self._seen: return
+
+		order = self._order
+
+		if len(order) == order.maxlen:
+
+			self._seen.discard(order[0])	# deque drops it on append
+
+		order.append(key)
+		self._seen.add(key)
+
 #———————————————————————————————————————————————————————————————————————————————
 # Time Utilities
 #———————————————————————————————————————————————————————————————————————————————
@@ -157,26 +255,283 @@ def ms_to_datetime(ms: int) -> datetime:
 	return datetime.fromtimestamp(ms / 1000.0, tz = timezone.utc)
 
 #———————————————————————————————————————————————————————————————————————————————
+# Integer-only UTC calendar fields (no `datetime`, no tzinfo, no `strftime`)
+# https://howardhinnant.github.io/date_algorithms.html#civil_from_days
+#———————————————————————————————————————————————————————————————————————————————
 
-def get_cur_datetime_str() -> str:
+def civil_from_days(days: int) -> tuple[int, int, int]:
+
+	"""
+	Converts days since 1970-01-01 into a proleptic Gregorian
+	(year, month, day) tuple.
+	"""
+
+	z	= days + 719_468
+	era	= z // 146_097
+	doe	= z - era * 146_097
+	yoe	= (doe - doe // 1460 + doe // 36_524 - doe // 146_096) // 365
+	doy	= doe - (365 * yoe + yoe // 4 - yoe // 100)
+	mp	= (5 * doy + 2) // 153
+	d	= doy - (153 * mp + 2) // 5 + 1
+	m	= mp + 3 if mp < 10 else mp - 9
+
+	return (yoe + era * 400 + (m <= 2), m, d)
+
+def utc_fields_from_ms(ms: int) -> tuple[int, int, int, int, int, int, int]:
+
+	"""
+	Returns (year, month, day, hour, minute, second, millisecond) in UTC.
+	"""
+
+	days, ms_of_day = divmod(ms, 86_400_000)
+	sec_of_day, milli = divmod(ms_of_day, 1000)
+	hh, rem = divmod(sec_of_day, 3600)
+	mm, ss = divmod(rem, 60)
+
+	return (*civil_from_days(days), hh, mm, ss, milli)
+
+#———————————————————————————————————————————————————————————————————————————————
+
+def format_utc_ms(ms: int) -> str:
+
+	"""
+	'%Y-%m-%d %H:%M:%S.mmmZ'
+	"""
+
+	y, mo, d, hh, mm, ss, milli = utc_fields_from_ms(ms)
 
-	dt = ms_to_datetime(
-		get_current_time_ms()
-	)
-	
 	return (
-		dt.strftime("%Y-%m-%d %H:%M:%S.") 
-		+ f"{dt.microsecond // 1000:03d}Z"
+		f"{y:04d}-{mo:02d}-{d:02d} "
+		f"{hh:02d}:{mm:02d}:{ss:02d}.{milli:03d}Z"
 	)
 
 #———————————————————————————————————————————————————————————————————————————————
 
+def get_cur_datetime_str() -> str:
+
+	return format_utc_ms(get_current_time_ms())
+
+#———————————————————————————————————————————————————————————————————————————————
+
 def update_shared_time_dict(
 	shared_time_dict: dict[str, float],
 	key: str,
 ):
 
-	shared_time_dict[key] = time.time()
+	# monotonic: only ever differenced, so wall-clock steps (NTP)
+	# can neither skip nor stretch the reconnect spacing
+	shared_time_dict[key] = time.monotonic()
+
+#———————————————————————————————————————————————————————————————————————————————
+# File Utilities
+#———————————————————————————————————————————————————————————————————————————————
+
+FILE_GZIP_LEVEL		   = 1				# favour throughput over ratio
+MERGE_ZIP_LEVEL		   = 1				# daily archive: same trade-off
+
+class GzipAppender(io.BufferedIOBase):
+
+	"""
+	Append-only gzip writer that keeps compression off the writing thread.
+	`write()` only queues the bytes (`deque.append`, safe against a drain
+	running in another thread). `flush()` and `close()` drain the queue
+	into the `GzipFile` under a lock and end with Z_SYNC_FLUSH, so they can
+	run in a worker thread while the event loop keeps writing, and a
+	flushed record survives a kill with the part still inflatable.
+	"""
+
+	def __init__(self, gz: gzip.GzipFile):
+
+		super().__init__()
+
+		self._gz	  = gz
+		self._pending = deque()
+		self._io_lock = threading.Lock()
+
+	def writable(self) -> bool:
+
+		return True
+
+	def write(self, b) -> int:
+
+		if self.closed:
+			raise ValueError("I/O operation on closed file.")
+
+		self._pending.append(b)
+		return len(b)
+
+	def _drain(self):		# caller holds `_io_lock`
+
+		pending = self._pending
+		if not pending: return
+
+		chunks = []
+		popleft = pending.popleft
+
+		try:
+			while True: chunks.append(popleft())
+		except IndexError: pass
+
+		self._gz.write(b"".join(chunks))
+
+	def flush(self):
+
+		with self._io_lock:
+
+			if self._gz.closed: return
+
+			self._drain()
+			self._gz.flush()				# Z_SYNC_FLUSH + file flush
+
+	def close(self):
+
+		if self.closed: return
+
+		with self._io_lock:
+
+			try:     self._drain()
+			finally: self._gz.close()
+
+		super().close()
+
+def open_gzip_appender(file_path: str) -> GzipAppender:
+
+	"""
+	Opens `file_path` for appending compressed records. Each open adds a
+	new gzip member, which `gzip.open` reads back as one stream, so a
+	restart within the same minute is harmless. Records are queued in
+	memory and reach the file on `flush()` (see `GzipAppender`).
+	"""
+
+	return GzipAppender(
+		gzip.GzipFile(file_path, "ab", compresslevel = FILE_GZIP_LEVEL)
+	)
+
+#———————————————————————————————————————————————————————————————————————————————
+# Optional ISA-L (`pip install isal`) for the daily merge workers. `zipfile`
+# looks up `zlib.compressobj` and `crc32` through its module globals, so
+# pointing those at `isal_zlib` swaps in the SIMD deflate/CRC without
+# touching the container format. Only call this inside a merge worker.
+#———————————————————————————————————————————————————————————————————————————————
+
+def enable_isal_for_zipfile() -> bool:
+
+	try:
+
+		from isal import isal_zlib
+		import zipfile
+
+	except ImportError:
+
+		return False
+
+	if zipfile.zlib is not isal_zlib:
+
+		zipfile.zlib  = isal_zlib
+		zipfile.crc32 = isal_zlib.crc32
+
+	return True
+
+def open_gzip_reader(file_path: str, use_isal: bool = False) -> io.IOBase:
+
+	"""
+	Reads a multi-member `.gz` part back as one stream. With ISA-L the
+	inflate side of the merge is SIMD as well; `isal.igzip` mirrors
+	`gzip.open`, including EOFError on a truncated member.
+	"""
+
+	if use_isal:
+
+		try:
+
+			from isal import igzip
+			return igzip.open(file_path, "rb")
+
+		except ImportError: pass
+
+	return gzip.open(file_path, "rb")
+
+def copy_gzip_part(
+	file_path:	 str,
+	fout:		 io.IOBase,
+	record_size: int  = 0,
+	chunk_size:	 int  = 1 << 20,
+	use_isal:	 bool = False,
+) -> Optional[int]:
+
+	"""
+	Streams a `.gz` part into `fout`, only ever writing whole records:
+	lines when `record_size` is 0, fixed `record_size` blocks otherwise.
+	A part cut short by a hard kill ends mid-record; that tail is dropped
+	so the next part stays aligned. Returns the dropped byte count for a
+	truncated part and None for a complete one.
+	"""
+
+	buf = bytearray()
+
+	with open_gzip_reader(file_path, use_isal) as f:
+
+		try:
+
+			while chunk := f.read(chunk_size):
+
+				buf += chunk
+
+				if record_size > 0:
+					cut = len(buf) - len(buf) % record_size
+				else:
+					cut = buf.rfind(b"\n") + 1
+
+				if cut:
+
+					fout.write(buf[:cut])
+					del buf[:cut]
+
+		except EOFError:
+
+			return len(buf)
+
+	if buf: fout.write(buf)		# complete part: keep it byte-exact
+
+	return None
+
+async def flush_file_handles_periodically(
+	fhndls_list:	list[dict[str, tuple]],
+	interval_sec:	float,
+	logger:			logging.Logger,
+	shutdown_event:	asyncio.Event,
+):
+
+	"""
+	Writers no longer flush on every record; this watchdog bounds the
+	data-loss window to `interval_sec` by flushing all live handles.
+	Each flush (deflate, Z_SYNC_FLUSH, write syscall) runs in a worker
+	thread via `asyncio.to_thread`; `GzipAppender` serialises it against
+	a concurrent rollover close, and record writes never wait on it.
+	"""
+
+	while not shutdown_event.is_set():
+
+		await asyncio.sleep(interval_sec)
+
+		for fhndls in fhndls_list:
+
+			for symbol, (suffix, writer) in tuple(fhndls.items()):
+
+				try:
+
+					if writer is not None and not writer.closed:
+						await asyncio.to_thread(writer.flush)
+
+				except ValueError: pass		# closed during rollover
+
+				except Exception as e:
+
+					logger.error(
+						f"[{my_name()}][{symbol.upper()}] "
+						f"periodic flush failed: {e}",
+						exc_info = True,
+					)
 
 #———————————————————————————————————————————————————————————————————————————————
 
@@ -275,6 +630,61 @@ class NanoTimer:
 
 		pass
 
+#———————————————————————————————————————————————————————————————————————————————
+# Queue Utilities
+#———————————————————————————————————————————————————————————————————————————————
+
+class ConflatingQueue:
+
+	"""
+	Single-producer / single-consumer queue with the `asyncio.Queue`
+	subset used here. `put_nowait` never blocks: at `maxsize` the oldest
+	item is dropped by the underlying `deque(maxlen)` and counted in
+	`dropped`. The consumer sleeps on one Event, so a put allocates no
+	Future and wakes at most one waiter.
+	"""
+
+	__slots__ = ("maxsize", "dropped", "_items", "_ready")
+
+	def __init__(self, maxsize: int = 0):
+
+		self.maxsize = maxsize
+		self.dropped = 0
+		self._items: deque = deque(
+			maxlen = maxsize if maxsize > 0 else None
+		)
+		self._ready = asyncio.Event()
+
+	def qsize(self) -> int:
+
+		return len(self._items)
+
+	def empty(self) -> bool:
+
+		return not self._items
+
+	def put_nowait(self, item):
+
+		if 0 < self.maxsize <= len(self._items):
+			self.dropped += 1
+
+		self._items.append(item)
+		self._ready.set()
+
+	def get_nowait(self):
+
+		try: return self._items.popleft()
+		except IndexError: raise asyncio.QueueEmpty from None
+
+	async def get(self):
+
+		while not self._items:
+
+			self._ready.clear()
+			await self._ready.wait()
+
+		return self._items.popleft()
+
 #———————————————————————————————————————————————————————————————————————————————
 # Web Utilities
 #———————————————————————————————————————————————————————————————————————————————
@@ -489,6 +899,63 @@ async def elaborate_ws_peer(
 
 #———————————————————————————————————————————————————————————————————————————————
 
+def tune_ws_socket(ws) -> None:
+
+	"""
+	Low-latency options on a connected client websocket. asyncio and
+	uvloop already set TCP_NODELAY; it is re-asserted here next to
+	TCP_QUICKACK (Linux), which acks the 100 ms depth frames at once
+	instead of after the delayed-ACK timer. SO_RCVBUF is left to the
+	kernel's autotuning, which a fixed size would switch off.
+	"""
+
+	sock = ws.transport.get_extra_info("socket")
+
+	if sock is None:
+		return
+
+	try:
+
+		sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+		if hasattr(socket, "TCP_QUICKACK"):
+			sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+
+	except OSError: pass
+
+#———————————————————————————————————————————————————————————————————————————————
+
+def bind_listen_socket(
+	host:	 str,
+	port:	 int,
+	backlog: int = 2048,
+) -> socket.socket:
+
+	"""
+	Binds the dashboard's listening socket up front so that a busy port
+	fails before uvicorn starts, and so that socket options are owned
+	here rather than by `uvicorn.Config.bind_socket`.
+	"""
+
+	sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+
+	try:
+
+		sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+		sock.bind((host, port))
+		sock.listen(backlog)
+		sock.setblocking(False)
+
+	except OSError:
+
+		sock.close()
+		raise
+
+	return sock
+
+#———————————————————————————————————————————————————————————————————————————————
+
 def format_ws_url(	# checks # of symbols 
 	url: str, 
 	symbols: list[str],
@@ -655,17 +1122,14 @@ class UTCFormatter(logging.Formatter):
 
 	def formatTime(self, record, datefmt = None):
 
-		dt = datetime.fromtimestamp(
-			record.created,
-			tz = timezone.utc,
-		)
+		if datefmt:
 
-		if datefmt: return dt.strftime(datefmt)
-		
-		return (
-			dt.strftime("%Y-%m-%d %H:%M:%S.")
-			+ f"{dt.microsecond // 1000:03d}Z"
-		)
+			return datetime.fromtimestamp(
+				record.created,
+				tz = timezone.utc,
+			).strftime(datefmt)
+
+		return format_utc_ms(int(record.created * 1000))
 
 #———————————————————————————————————————————————————————————————————————————————
 
@@ -909,6 +1373,35 @@ def ensure_logging_on_exception(
 
 #———————————————————————————————————————————————————————————————————————————————
 
+async def run_isolated(
+	coro:	Awaitable,
+	name:	str,
+	logger:	logging.Logger,
+):
+
+	"""
+	TaskGroup child wrapper: a failing coroutine is logged and ends on
+	its own instead of cancelling its siblings, as with the plain
+	`asyncio.create_task` launches this replaces. Cancellation passes.
+	"""
+
+	try:
+
+		return await coro
+
+	except asyncio.CancelledError:
+
+		raise
+
+	except Exception as e:
+
+		logger.error(
+			f"[{my_name()}] {name} stopped; "
+			f"other tasks keep running → {e}"
+		)
+
+#———————————————————————————————————————————————————————————————————————————————
+
 def force_print_exception(
 	scope_name: str,
 	e: Optional[Exception] = None, 